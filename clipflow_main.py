@@ -6,30 +6,96 @@ Orchestrates all components: Bot, Processing, Publishing, Scheduling, Analytics
 
 import os
 import asyncio
+import importlib
 import logging
+import secrets
+import signal
+import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Sequence, Tuple, Type, Union
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
+from functools import cached_property
 
-# Import all ClipFlow components
-from services.bot.main import ClipFlowBot
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Import always-needed ClipFlow components. Processors, platform publishers and the
+# bot pull in heavy dependencies and are imported on first use instead.
 from services.processor.content_pipeline import ContentManager, ContentType, Platform
-from core.video_processor import VideoProcessor
-from core.image_processor import ImageProcessor
-from core.text_to_visual import TextToVisualGenerator
-from core.audio_processor import AudioProcessor
-from core.publishers.base_publisher import PublishManager, create_video_payload, create_image_payload, create_text_payload, PlatformCredentials
-from core.publishers.youtube_publisher import YouTubePublisher
-from core.publishers.instagram_publisher import InstagramPublisher
-from core.publishers.tiktok_publisher import TikTokPublisher
-from core.scheduler.smart_scheduler import SmartScheduler, PostMetrics
+from core.publishers.base_publisher import BasePublisher, PublishManager, create_video_payload, create_image_payload, create_text_payload, PlatformCredentials
+from core.scheduler.smart_scheduler import SmartScheduler, PostMetrics, ScheduleRecommendation
 from core.analytics.metrics_collector import MetricsCollector, ContentMetrics, AnalyticsDashboard
 from core.brand import BrandManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent metrics requests per platform API
+PLATFORM_FETCH_CONCURRENCY: Dict[str, int] = {
+    "youtube": 10,
+    "instagram": 5,
+    "tiktok": 5
+}
+DEFAULT_FETCH_CONCURRENCY = 5
+
+# Platforms content can be processed for, and the default target set
+SUPPORTED_PLATFORMS = frozenset({"instagram", "youtube", "tiktok"})
+DEFAULT_PLATFORMS: Tuple[str, ...] = ("instagram", "youtube", "tiktok")
+
+# Platforms whose credentials can be read from environment variables
+ENV_CREDENTIAL_PLATFORMS: Tuple[str, ...] = ("youtube", "instagram", "tiktok")
+
+# Background task intervals, in seconds
+METRICS_COLLECTION_INTERVAL = 3600
+METRICS_RETRY_DELAY = 300
+HEARTBEAT_INTERVAL = 3600
+
+# Caption and hashtags used when auto-publishing without explicit values
+DEFAULT_CAPTION = "Amazing content created with ClipFlow! 🚀"
+DEFAULT_HASHTAGS: Tuple[str, ...] = ("clipflow", "automation", "content")
+
+# Publisher implementation for each platform name used in credentials, either as a
+# class or as a "module:Class" path that is imported the first time it is needed
+PUBLISHER_REGISTRY: Dict[str, Union[str, Type[BasePublisher]]] = {
+    "youtube": "core.publishers.youtube_publisher:YouTubePublisher",
+    "instagram": "core.publishers.instagram_publisher:InstagramPublisher",
+    "tiktok": "core.publishers.tiktok_publisher:TikTokPublisher"
+}
+
+def register_publisher(platform: str):
+    """Class decorator registering a publisher for a platform name"""
+    def decorator(cls: Type[BasePublisher]) -> Type[BasePublisher]:
+        PUBLISHER_REGISTRY[platform] = cls
+        return cls
+    return decorator
+
+def _resolve_publisher(platform: str) -> Optional[Type[BasePublisher]]:
+    """Get the publisher class for a platform, importing it if necessary"""
+    entry = PUBLISHER_REGISTRY.get(platform)
+    if isinstance(entry, str):
+        module_name, class_name = entry.split(":")
+        entry = getattr(importlib.import_module(module_name), class_name)
+        PUBLISHER_REGISTRY[platform] = entry
+    return entry
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 @dataclass
 class ClipFlowConfig:
     """Main configuration for ClipFlow"""
@@ -63,25 +129,57 @@ class ClipFlowConfig:
                 "watermark_text": "Created with ClipFlow"
             }
 
+@dataclass
+class ContentProcessingReport:
+    """Outcome of processing a Telegram submission"""
+    content_id: Optional[str]
+    processed_files: List[Dict[str, Any]] = field(default_factory=list)
+    scheduling_recommendations: List[Dict[str, Any]] = field(default_factory=list)
+    processing_status: str = "processed"
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the bot/API layer, omitting error on success"""
+        result = asdict(self)
+        if self.error is None:
+            del result["error"]
+        return result
+
+@dataclass
+class PublishReport:
+    """Outcome of publishing or scheduling content across platforms"""
+    content_id: str
+    publish_results: List[Dict[str, Any]] = field(default_factory=list)
+    scheduled_posts: List[Dict[str, Any]] = field(default_factory=list)
+    total_success: int = 0
+    total_failed: int = 0
+    publish_status: str = "completed"
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the bot/API layer, omitting error on success"""
+        result = asdict(self)
+        if self.error is None:
+            del result["error"]
+        return result
+
 class ClipFlowOrchestrator:
     """Main orchestrator that coordinates all ClipFlow components"""
     
     def __init__(self, config: ClipFlowConfig):
         self.config = config
         
-        # Initialize core components
+        # Initialize core components (media processors are created on first access)
         self.content_manager = ContentManager(config.data_dir)
-        self.video_processor = VideoProcessor(config.temp_dir, config.output_dir)
-        self.image_processor = ImageProcessor(config.temp_dir, config.output_dir) 
-        self.text_generator = TextToVisualGenerator(config.temp_dir, config.output_dir)
-        self.audio_processor = AudioProcessor(config.temp_dir, config.output_dir)
         
         # Initialize publishing
         self.publish_manager = PublishManager()
+        self._platform_semaphores: Dict[str, asyncio.Semaphore] = {}
         self._setup_publishers()
         
         # Initialize scheduling and analytics
         self.scheduler = SmartScheduler(config.data_dir, config.timezone)
+        self._optimal_time_cache: Dict[Tuple[str, int], ScheduleRecommendation] = {}
         self.metrics_collector = MetricsCollector(config.data_dir)
         self.analytics_dashboard = AnalyticsDashboard(self.metrics_collector)
         
@@ -91,43 +189,91 @@ class ClipFlowOrchestrator:
         # Initialize bot (will be started separately)
         self.bot = None
         if config.telegram_bot_token:
+            from services.bot.main import ClipFlowBot
             self.bot = ClipFlowBot(config.telegram_bot_token)
             self.bot.set_orchestrator(self)  # Give bot access to orchestrator
     
+    @cached_property
+    def video_processor(self):
+        """Video processor, imported and created on first use"""
+        from core.video_processor import VideoProcessor
+        return VideoProcessor(self.config.temp_dir, self.config.output_dir)
+    
+    @cached_property
+    def image_processor(self):
+        """Image processor, imported and created on first use"""
+        from core.image_processor import ImageProcessor
+        return ImageProcessor(self.config.temp_dir, self.config.output_dir)
+    
+    @cached_property
+    def text_generator(self):
+        """Text-to-visual generator, imported and created on first use"""
+        from core.text_to_visual import TextToVisualGenerator
+        return TextToVisualGenerator(self.config.temp_dir, self.config.output_dir)
+    
+    @cached_property
+    def audio_processor(self):
+        """Audio processor, imported and created on first use"""
+        from core.audio_processor import AudioProcessor
+        return AudioProcessor(self.config.temp_dir, self.config.output_dir)
+    
     def _setup_publishers(self):
         """Setup platform publishers based on credentials"""
         
         for platform, creds in self.config.platform_credentials.items():
             try:
+                publisher_cls = _resolve_publisher(platform)
+                if publisher_cls is None:
+                    logger.warning(
+                        f"Unknown platform: {platform} "
+                        f"(registered: {', '.join(sorted(PUBLISHER_REGISTRY))})"
+                    )
+                    continue
+                
                 platform_creds = PlatformCredentials(
                     platform=platform,
                     credentials=creds
                 )
                 
-                if platform == "youtube":
-                    publisher = YouTubePublisher(platform_creds)
-                elif platform == "instagram":
-                    publisher = InstagramPublisher(platform_creds)
-                elif platform == "tiktok":
-                    publisher = TikTokPublisher(platform_creds)
-                else:
-                    logger.warning(f"Unknown platform: {platform}")
-                    continue
-                
-                self.publish_manager.add_publisher(publisher)
+                self.publish_manager.add_publisher(publisher_cls(platform_creds))
                 logger.info(f"Added publisher for {platform}")
                 
             except Exception as e:
                 logger.error(f"Failed to setup {platform} publisher: {e}")
     
+    async def _get_optimal_time(self, platform: str) -> ScheduleRecommendation:
+        """Get the scheduler's recommendation, reusing it within the same minute"""
+        bucket = int(time.time() // 60)
+        key = (platform, bucket)
+        
+        recommendation = self._optimal_time_cache.get(key)
+        if recommendation is None:
+            # Drop entries from earlier minutes so the cache stays small
+            self._optimal_time_cache = {
+                k: v for k, v in self._optimal_time_cache.items() if k[1] == bucket
+            }
+            recommendation = await self.scheduler.get_optimal_time(platform)
+            self._optimal_time_cache[key] = recommendation
+        
+        return recommendation
+    
     async def process_content_from_telegram(self, user_id: int, content_type: str,
                                           file_path: str = None, text_content: str = None,
-                                          caption: str = "", platforms: List[str] = None) -> Dict[str, Any]:
-        """Process content received from Telegram bot"""
+                                          caption: str = "", platforms: List[str] = None,
+                                          on_result: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+                                          ) -> Dict[str, Any]:
+        """Process content received from Telegram bot
+        
+        Platforms are processed concurrently, so processed_files and
+        scheduling_recommendations are in completion order rather than the order of
+        platforms. If on_result is given it is awaited with each processed file entry
+        as soon as that platform finishes, so the bot can report progress before the
+        slowest platform completes; if it raises, platforms still running are cancelled.
+        """
         
         try:
-            # Generate unique content ID
-            content_id = f"{user_id}_{int(datetime.now().timestamp())}"
+            # Generate unique content ID; the random suffix keeps same-instant submissions apart
+            content_id = f"{user_id}_{time.time_ns()}_{secrets.token_hex(3)}"
             
             # Determine content type
             if content_type == "video":
@@ -153,62 +299,60 @@ class ClipFlowOrchestrator:
             
             # Get platform list
             if not platforms:
-                platforms = ["instagram", "youtube", "tiktok"]  # Default platforms
+                platforms = DEFAULT_PLATFORMS
             
-            platform_enums = [Platform(p) for p in platforms if p in ["instagram", "youtube", "tiktok"]]
-            
-            # Process content for each platform
-            processing_results = await self.content_manager.process_content(content_item, platform_enums)
+            platform_enums = [Platform(p) for p in platforms if p in SUPPORTED_PLATFORMS]
             
             # Prepare results
-            results = {
-                "content_id": content_id,
-                "processed_files": [],
-                "scheduling_recommendations": [],
-                "publishing_status": "processed"
-            }
+            report = ContentProcessingReport(content_id=content_id)
             
-            for result in processing_results:
-                if result.success:
-                    results["processed_files"].append({
-                        "platform": result.platform.value,
-                        "file_path": result.output_path,
-                        "caption": result.caption
-                    })
-                    
-                    # Get scheduling recommendation
-                    recommendation = await self.scheduler.get_optimal_time(result.platform.value)
-                    results["scheduling_recommendations"].append({
-                        "platform": result.platform.value,
-                        "recommended_time": recommendation.local_time,
-                        "score": recommendation.score,
-                        "reason": recommendation.reason
-                    })
-                else:
-                    logger.error(f"Processing failed for {result.platform.value}: {result.error}")
-            
-            return results
+            # Process content for each platform, handling results as they complete
+            processing_results = self.content_manager.process_content(content_item, platform_enums)
+            try:
+                async for result in processing_results:
+                    if result.success:
+                        processed_file = {
+                            "platform": result.platform.value,
+                            "file_path": result.output_path,
+                            "caption": result.caption
+                        }
+                        report.processed_files.append(processed_file)
+                        
+                        if on_result:
+                            await on_result(processed_file)
+                        
+                        # Get scheduling recommendation
+                        recommendation = await self._get_optimal_time(result.platform.value)
+                        report.scheduling_recommendations.append({
+                            "platform": result.platform.value,
+                            "recommended_time": recommendation.local_time,
+                            "score": recommendation.score,
+                            "reason": recommendation.reason
+                        })
+                    else:
+                        logger.error(f"Processing failed for {result.platform.value}: {result.error}")
+            finally:
+                # Close the stream now so platforms still in flight are cancelled
+                await processing_results.aclose()
+            
+            return report.to_dict()
             
         except Exception as e:
             logger.error(f"Error processing content from Telegram: {e}")
-            return {
-                "error": str(e),
-                "content_id": None,
-                "processing_status": "failed"
-            }
+            return ContentProcessingReport(
+                content_id=None,
+                processing_status="failed",
+                error=str(e)
+            ).to_dict()
     
     async def auto_publish_content(self, user_id: int, content_id: str, 
-                                 platforms: List[str], schedule: bool = True) -> Dict[str, Any]:
+                                 platforms: List[str], schedule: bool = True,
+                                 caption: str = DEFAULT_CAPTION,
+                                 hashtags: Sequence[str] = DEFAULT_HASHTAGS) -> Dict[str, Any]:
         """Automatically publish or schedule content"""
         
         try:
-            results = {
-                "content_id": content_id,
-                "publish_results": [],
-                "scheduled_posts": [],
-                "total_success": 0,
-                "total_failed": 0
-            }
+            report = PublishReport(content_id=content_id)
             
             # Get processed files (this would be retrieved from content manager)
             # For now, simulating file paths
@@ -227,8 +371,8 @@ class ClipFlowOrchestrator:
                         file_path = processed_files[rec.platform]
                         payload = create_video_payload(
                             video_path=file_path,
-                            caption="Amazing content created with ClipFlow! 🚀",
-                            hashtags=["clipflow", "automation", "content"]
+                            caption=caption,
+                            hashtags=hashtags
                         )
                         
                         # Schedule the post
@@ -236,7 +380,7 @@ class ClipFlowOrchestrator:
                             payload, rec.datetime_utc.isoformat()
                         )
                         
-                        results["scheduled_posts"].append({
+                        report.scheduled_posts.append({
                             "platform": rec.platform,
                             "scheduled_time": rec.local_time,
                             "success": schedule_result.success,
@@ -244,9 +388,9 @@ class ClipFlowOrchestrator:
                         })
                         
                         if schedule_result.success:
-                            results["total_success"] += 1
+                            report.total_success += 1
                         else:
-                            results["total_failed"] += 1
+                            report.total_failed += 1
             
             else:
                 # Publish immediately
@@ -255,13 +399,13 @@ class ClipFlowOrchestrator:
                         file_path = processed_files[platform]
                         payload = create_video_payload(
                             video_path=file_path,
-                            caption="Amazing content created with ClipFlow! 🚀",
-                            hashtags=["clipflow", "automation", "content"]
+                            caption=caption,
+                            hashtags=hashtags
                         )
                         
                         publish_result = await self.publish_manager.publish_to_platform(platform, payload)
                         
-                        results["publish_results"].append({
+                        report.publish_results.append({
                             "platform": platform,
                             "success": publish_result.success,
                             "url": publish_result.url,
@@ -270,72 +414,108 @@ class ClipFlowOrchestrator:
                         })
                         
                         if publish_result.success:
-                            results["total_success"] += 1
+                            report.total_success += 1
                             
-                            # Record metrics for learning
+                            # Record metrics for learning. Hour and weekday come from the
+                            # same UTC timestamp, matching how scheduler slots are keyed
+                            published_at = datetime.now(timezone.utc)
                             metrics = PostMetrics(
                                 post_id=publish_result.post_id,
                                 platform=platform,
-                                publish_time=datetime.now(timezone.utc),
-                                hour=datetime.now().hour,
-                                day_of_week=datetime.now().weekday(),
+                                publish_time=published_at,
+                                hour=published_at.hour,
+                                day_of_week=published_at.weekday(),
                                 engagement_rate=0.0  # Will be updated later
                             )
                             await self.scheduler.record_post_performance(metrics)
+                            # New performance data can change the best slot
+                            self._optimal_time_cache.clear()
                             
                         else:
-                            results["total_failed"] += 1
+                            report.total_failed += 1
             
-            return results
+            return report.to_dict()
             
         except Exception as e:
             logger.error(f"Error in auto_publish_content: {e}")
-            return {
-                "error": str(e),
-                "content_id": content_id,
-                "publish_status": "failed"
-            }
+            return PublishReport(
+                content_id=content_id,
+                publish_status="failed",
+                error=str(e)
+            ).to_dict()
     
-    async def collect_platform_metrics(self, user_id: int) -> Dict[str, Any]:
-        """Collect metrics from all connected platforms"""
+    def _get_platform_semaphore(self, platform_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent API calls to a platform"""
+        semaphore = self._platform_semaphores.get(platform_name)
+        if semaphore is None:
+            limit = PLATFORM_FETCH_CONCURRENCY.get(platform_name, DEFAULT_FETCH_CONCURRENCY)
+            semaphore = asyncio.Semaphore(limit)
+            self._platform_semaphores[platform_name] = semaphore
+        return semaphore
+    
+    async def _fetch_post_metrics(self, publisher, platform_name: str, post_id: str) -> Dict[str, Any]:
+        """Fetch metrics for a single post within the platform's concurrency limit"""
+        async with self._get_platform_semaphore(platform_name):
+            return await publisher.get_post_metrics(post_id)
+    
+    async def _collect_from_platform(self, user_id: int, platform_name: str,
+                                     publisher) -> List[ContentMetrics]:
+        """Fetch metrics for recent posts on one platform without storing them"""
+        
+        collected = []
         
         try:
-            all_metrics = []
+            # In real implementation, would get recent post IDs from database
+            # For now, simulating with placeholder data
+            recent_posts = ["post1", "post2", "post3"]  # Would come from database
             
-            # Get recent posts for each platform
-            for platform_name, publisher in self.publish_manager.publishers.items():
-                try:
-                    # In real implementation, would get recent post IDs from database
-                    # For now, simulating with placeholder data
+            # Fetch all posts concurrently; the semaphore keeps us within rate limits
+            metrics_results = await asyncio.gather(*(
+                self._fetch_post_metrics(publisher, platform_name, post_id)
+                for post_id in recent_posts
+            ))
+            
+            fetched_at = datetime.now().isoformat()
+            
+            for post_id, metrics_data in zip(recent_posts, metrics_results):
+                if "error" not in metrics_data:
+                    # Convert to ContentMetrics format
+                    content_metrics = ContentMetrics(
+                        content_id=f"content_{post_id}",
+                        user_id=user_id,
+                        platform=platform_name,
+                        content_type="video",  # Would be retrieved from database
+                        post_id=post_id,
+                        post_url=metrics_data.get("video_url", ""),
+                        published_at=metrics_data.get("published_at", fetched_at),
+                        views=metrics_data.get("views", 0),
+                        likes=metrics_data.get("likes", 0),
+                        comments=metrics_data.get("comments", 0),
+                        shares=metrics_data.get("shares", 0),
+                        engagement_rate=0.0  # Will be calculated
+                    )
                     
-                    # Simulate getting metrics for recent posts
-                    recent_posts = ["post1", "post2", "post3"]  # Would come from database
+                    collected.append(content_metrics)
                     
-                    for post_id in recent_posts:
-                        metrics_data = await publisher.get_post_metrics(post_id)
-                        
-                        if "error" not in metrics_data:
-                            # Convert to ContentMetrics format
-                            content_metrics = ContentMetrics(
-                                content_id=f"content_{post_id}",
-                                user_id=user_id,
-                                platform=platform_name,
-                                content_type="video",  # Would be retrieved from database
-                                post_id=post_id,
-                                post_url=metrics_data.get("video_url", ""),
-                                published_at=metrics_data.get("published_at", datetime.now().isoformat()),
-                                views=metrics_data.get("views", 0),
-                                likes=metrics_data.get("likes", 0),
-                                comments=metrics_data.get("comments", 0),
-                                shares=metrics_data.get("shares", 0),
-                                engagement_rate=0.0  # Will be calculated
-                            )
-                            
-                            await self.metrics_collector.store_metrics(content_metrics)
-                            all_metrics.append(content_metrics)
-                            
-                except Exception as e:
-                    logger.error(f"Error collecting metrics from {platform_name}: {e}")
+        except Exception as e:
+            logger.error(f"Error collecting metrics from {platform_name}: {e}")
+        
+        return collected
+    
+    async def collect_platform_metrics(self, user_id: int) -> Dict[str, Any]:
+        """Collect metrics from all connected platforms"""
+        
+        try:
+            # Platforms are independent, so collect them concurrently
+            platform_results = await asyncio.gather(*(
+                self._collect_from_platform(user_id, platform_name, publisher)
+                for platform_name, publisher in self.publish_manager.publishers.items()
+            ))
+            all_metrics = [metrics for collected in platform_results for metrics in collected]
+            
+            # Persist the whole collection cycle in one batch instead of one write per post
+            if all_metrics:
+                await self.metrics_collector.batch_store_metrics(all_metrics)
             
             return {
                 "collected_metrics": len(all_metrics),
@@ -347,6 +527,18 @@ class ClipFlowOrchestrator:
             logger.error(f"Error collecting platform metrics: {e}")
             return {"error": str(e)}
     
+    async def _get_active_users(self) -> List[int]:
+        """Get users whose platform metrics should be collected"""
+        # In a real app, would get list of active users from the database
+        return [12345]  # Placeholder
+    
+    async def collect_all_active_users_metrics(self) -> Dict[int, Dict[str, Any]]:
+        """Collect platform metrics for every active user"""
+        results = {}
+        for user_id in await self._get_active_users():
+            results[user_id] = await self.collect_platform_metrics(user_id)
+        return results
+    
     async def generate_user_report(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Generate comprehensive user performance report"""
         
@@ -443,47 +635,43 @@ class ClipFlowOrchestrator:
             logger.error("Bot not configured - missing token")
     
     async def stop_bot(self):
-        """Stop the Telegram bot"""
+        """Stop the Telegram bot and release publisher, database and worker resources"""
         if self.bot:
             await self.bot.stop()
             logger.info("Telegram bot stopped")
+        await self.publish_manager.close_all()
+        self.metrics_collector.close()
+        if "image_processor" in self.__dict__:
+            # Only shut down the image pool if the lazy processor was ever created
+            self.image_processor.close()
 
 # Configuration loader
 class ConfigManager:
     """Manages ClipFlow configuration"""
     
     @staticmethod
-    def load_from_file(config_path: str) -> ClipFlowConfig:
-        """Load configuration from JSON file"""
+    async def load_from_file(config_path: str) -> ClipFlowConfig:
+        """Load configuration from JSON file without blocking the event loop"""
         
         if not os.path.exists(config_path):
             # Create default config
             default_config = ClipFlowConfig()
-            ConfigManager.save_to_file(default_config, config_path)
+            await ConfigManager.save_to_file(default_config, config_path, pretty=True)
             return default_config
         
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, Path(config_path).read_bytes)
+        config_data = _json_loads(data)
         
         return ClipFlowConfig(**config_data)
     
     @staticmethod
-    def save_to_file(config: ClipFlowConfig, config_path: str):
-        """Save configuration to JSON file"""
+    async def save_to_file(config: ClipFlowConfig, config_path: str, pretty: bool = False):
+        """Save configuration to JSON file, indented only when pretty is set"""
         
-        # Convert to dict
-        config_dict = {
-            "data_dir": config.data_dir,
-            "temp_dir": config.temp_dir,
-            "output_dir": config.output_dir,
-            "telegram_bot_token": config.telegram_bot_token,
-            "platform_credentials": config.platform_credentials,
-            "default_brand_config": config.default_brand_config,
-            "timezone": config.timezone
-        }
-        
-        with open(config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        data = _json_dumps(asdict(config), pretty=pretty)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, Path(config_path).write_bytes, data)
         
         logger.info(f"Configuration saved to {config_path}")
     
@@ -496,8 +684,7 @@ class ConfigManager:
         config.timezone = os.getenv("CLIPFLOW_TIMEZONE", "Asia/Baku")
         
         # Platform credentials from environment
-        platforms = ["youtube", "instagram", "tiktok"]
-        for platform in platforms:
+        for platform in ENV_CREDENTIAL_PLATFORMS:
             platform_creds = {}
             
             if platform == "youtube":
@@ -543,7 +730,7 @@ async def main():
         config = ConfigManager.load_from_env()
         logger.info("📁 Configuration loaded from environment variables")
     else:
-        config = ConfigManager.load_from_file(config_path)
+        config = await ConfigManager.load_from_file(config_path)
         logger.info(f"📁 Configuration loaded from {config_path}")
     
     # Initialize orchestrator
@@ -554,40 +741,80 @@ async def main():
     logger.info(f"🔍 Health check: {health['overall_status']}")
     logger.info(f"   Publishers: {health['components']['publishers']['total_configured']} configured")
     
+    # Shutdown is signalled rather than polled, so idle periods cost no wakeups
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:
+            # Not supported by the Windows event loop
+            pass
+    
+    async def wait_for_shutdown(timeout: float) -> bool:
+        """Sleep up to timeout seconds, returning True if shutdown was requested"""
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     # Start periodic tasks
     async def metrics_collection_task():
-        """Periodic metrics collection"""
-        while True:
+        """Periodic metrics collection with exponential back-off on failure"""
+        failures = 0
+        while not shutdown_event.is_set():
             try:
-                # In a real app, would get list of active users
-                active_users = [12345]  # Placeholder
-                
-                for user_id in active_users:
-                    await orchestrator.collect_platform_metrics(user_id)
-                
+                await orchestrator.collect_all_active_users_metrics()
                 logger.info("📊 Metrics collection completed")
-                await asyncio.sleep(3600)  # Run every hour
+                failures = 0
+                delay = METRICS_COLLECTION_INTERVAL
                 
             except Exception as e:
-                logger.error(f"Error in metrics collection task: {e}")
-                await asyncio.sleep(300)  # Retry in 5 minutes
+                failures += 1
+                delay = min(METRICS_RETRY_DELAY * 2 ** (failures - 1), METRICS_COLLECTION_INTERVAL)
+                logger.error(f"Error in metrics collection task: {e} (retrying in {delay}s)")
+            
+            if await wait_for_shutdown(delay):
+                break
+    
+    async def heartbeat_task():
+        """Periodic liveness log"""
+        while not await wait_for_shutdown(HEARTBEAT_INTERVAL):
+            logger.info("❤️  ClipFlow is healthy")
     
     # Start background tasks
     metrics_task = asyncio.create_task(metrics_collection_task())
+    heartbeat = None
     
     try:
         # Start the bot if configured
         if config.telegram_bot_token:
             logger.info("🤖 Starting Telegram bot...")
-            await orchestrator.start_bot()
+            
+            # Race the bot against the shutdown signal so SIGINT/SIGTERM still stop it
+            bot_task = asyncio.create_task(orchestrator.start_bot())
+            shutdown_wait = asyncio.create_task(shutdown_event.wait())
+            await asyncio.wait({bot_task, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if bot_task.done():
+                shutdown_wait.cancel()
+                bot_task.result()  # Re-raise a bot failure
+            else:
+                logger.info("🛑 Shutdown requested")
+                bot_task.cancel()
+                try:
+                    await bot_task
+                except asyncio.CancelledError:
+                    pass
         else:
             logger.info("⚠️  No Telegram bot token configured")
             logger.info("🔧 ClipFlow is running without bot interface")
             
-            # Keep the application running
-            while True:
-                await asyncio.sleep(60)
-                logger.info("❤️  ClipFlow is healthy")
+            # Keep the application running until a shutdown signal arrives
+            heartbeat = asyncio.create_task(heartbeat_task())
+            await shutdown_event.wait()
+            logger.info("🛑 Shutdown requested")
     
     except KeyboardInterrupt:
         logger.info("🛑 Shutdown requested")
@@ -597,9 +824,26 @@ async def main():
     
     finally:
         # Cleanup
+        shutdown_event.set()
         metrics_task.cancel()
+        if heartbeat:
+            heartbeat.cancel()
         await orchestrator.stop_bot()
         logger.info("👋 ClipFlow shutdown complete")
 
+def run() -> None:
+    """Run main() on uvloop when it is installed, else on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+
+    if sys.version_info >= (3, 12):
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    else:
+        uvloop.install()
+        asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
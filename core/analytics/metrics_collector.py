@@ -8,17 +8,28 @@ import os
 import json
 import asyncio
 import logging
+import operator
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple, TypeVar, Union
 from dataclasses import dataclass, asdict
 import csv
+import itertools
 import sqlite3
-import statistics
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 @dataclass
 class ContentMetrics:
     """Comprehensive content performance metrics"""
@@ -91,63 +102,387 @@ class PerformanceReport:
     optimal_posting_times: Dict[str, List[int]]
     content_type_performance: Dict[str, float]
 
+# Worker threads running blocking SQLite calls for one collector
+DB_POOL_WORKERS = 4
+
+# Rows per transaction in batch_store_metrics; SQLite bulk inserts gain
+# little past a few thousand rows and larger chunks hold the lock longer
+DEFAULT_BATCH_CHUNK = 5000
+
+# Seconds a user's platform list and real-time dashboard stats are reused
+PLATFORMS_CACHE_TTL = 60.0
+REALTIME_CACHE_TTL = 60.0
+
+# Every content_metrics column, in table order
+_METRICS_COLUMNS = (
+    "content_id", "user_id", "platform", "content_type", "post_id", "post_url", "published_at",
+    "views", "impressions", "reach", "likes", "comments", "shares", "saves", "clicks",
+    "engagement_rate", "ctr", "completion_rate", "watch_time",
+    "publish_hour", "publish_day_of_week", "caption_length", "hashtag_count",
+    "duration", "file_size", "aspect_ratio", "collected_at", "last_updated",
+)
+
+# SQLite 3.31+ derives engagement_rate and ctr itself as stored generated
+# columns; older libraries fall back to computing them before the insert
+_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+
+_DERIVED_COLUMNS = {
+    "engagement_rate": (
+        "REAL GENERATED ALWAYS AS "
+        "(CAST(likes + comments + shares + saves AS REAL) / MAX(views, 1)) STORED"
+    ),
+    "ctr": (
+        "REAL GENERATED ALWAYS AS "
+        "(CASE WHEN impressions > 0 THEN CAST(clicks AS REAL) / impressions ELSE 0.0 END) STORED"
+    ),
+} if _GENERATED_COLUMNS else {}
+
+_CONTENT_METRICS_DDL = f"""
+    CREATE TABLE {{if_not_exists}}{{table}} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content_id TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
+        platform TEXT NOT NULL,
+        content_type TEXT NOT NULL,
+        post_id TEXT NOT NULL,
+        post_url TEXT,
+        published_at TEXT NOT NULL,
+        views INTEGER DEFAULT 0,
+        impressions INTEGER DEFAULT 0,
+        reach INTEGER DEFAULT 0,
+        likes INTEGER DEFAULT 0,
+        comments INTEGER DEFAULT 0,
+        shares INTEGER DEFAULT 0,
+        saves INTEGER DEFAULT 0,
+        clicks INTEGER DEFAULT 0,
+        engagement_rate {_DERIVED_COLUMNS.get("engagement_rate", "REAL DEFAULT 0.0")},
+        ctr {_DERIVED_COLUMNS.get("ctr", "REAL DEFAULT 0.0")},
+        completion_rate REAL DEFAULT 0.0,
+        watch_time INTEGER DEFAULT 0,
+        publish_hour INTEGER DEFAULT 0,
+        publish_day_of_week INTEGER DEFAULT 0,
+        caption_length INTEGER DEFAULT 0,
+        hashtag_count INTEGER DEFAULT 0,
+        duration REAL DEFAULT 0.0,
+        file_size INTEGER DEFAULT 0,
+        aspect_ratio TEXT DEFAULT "",
+        collected_at TEXT NOT NULL,
+        last_updated TEXT NOT NULL,
+        UNIQUE(content_id, platform)
+    )
+"""
+
+# Columns bound on insert; generated columns are left to SQLite
+_WRITE_COLUMNS = tuple(column for column in _METRICS_COLUMNS if column not in _DERIVED_COLUMNS)
+
+# Reads every bound column in one C-level call, returning the row tuple
+_write_values = operator.attrgetter(*_WRITE_COLUMNS)
+
+_INSERT_METRICS_SQL = (
+    f"INSERT OR REPLACE INTO content_metrics ({', '.join(_WRITE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_WRITE_COLUMNS))})"
+)
+
+# Applied to every connection: WAL lets readers run alongside the writer and
+# synchronous=NORMAL is durable under WAL without an fsync on every commit
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    # INSERT OR REPLACE only fires the rollup's delete trigger with this on
+    "PRAGMA recursive_triggers=ON",
+)
+
+# Projections for readers that only need a few fields per row
+_REALTIME_COLUMNS = ("post_id", "platform", "views", "likes", "comments", "shares", "engagement_rate")
+_BREAKDOWN_COLUMNS = ("content_type", "published_at", "views", "engagement_rate")
+
+# Ties keep the most recent post first, as the old stable sort did
+_TOP_PERFORMERS_SQL = """
+    SELECT * FROM content_metrics
+    WHERE user_id = ? AND published_at >= ?
+    ORDER BY engagement_rate DESC, published_at DESC
+    LIMIT ?
+"""
+
+_CONTENT_TYPE_PERFORMANCE_SQL = """
+    SELECT content_type, AVG(engagement_rate) AS avg_engagement_rate
+    FROM content_metrics
+    WHERE user_id = ? AND published_at >= ?
+    GROUP BY content_type
+    ORDER BY MAX(published_at) DESC
+"""
+
+_RECENT_BY_PLATFORM_SQL = f"""
+    SELECT platform, {', '.join(_BREAKDOWN_COLUMNS)} FROM (
+        SELECT platform, {', '.join(_BREAKDOWN_COLUMNS)},
+               ROW_NUMBER() OVER (PARTITION BY platform ORDER BY published_at DESC) AS recency
+        FROM content_metrics WHERE user_id = ?
+    )
+    WHERE recency <= ?
+    ORDER BY platform, recency
+"""
+
+# CSV export columns, in file order
+_CSV_EXPORT_COLUMNS = (
+    "content_id", "platform", "content_type", "post_id", "published_at",
+    "views", "likes", "comments", "shares", "saves", "engagement_rate",
+    "publish_hour", "publish_day_of_week", "duration",
+)
+
+_CSV_EXPORT_SQL = (
+    f"SELECT {', '.join(_CSV_EXPORT_COLUMNS)} FROM content_metrics "
+    "WHERE user_id = ? ORDER BY published_at DESC LIMIT ?"
+)
+
+# Filters shared by the platform summary queries (named parameters)
+_SUMMARY_WHERE = (
+    "user_id = :user_id AND platform = :platform "
+    "AND published_at >= :start AND published_at <= :end"
+)
+
+# Ties resolve to the most recent post, matching a scan in published_at DESC order
+_BEST_WORST_POSTS_SQL = f"""
+    SELECT (SELECT post_id FROM content_metrics WHERE {_SUMMARY_WHERE}
+            ORDER BY engagement_rate DESC, published_at DESC LIMIT 1) AS best_post,
+           (SELECT post_id FROM content_metrics WHERE {_SUMMARY_WHERE}
+            ORDER BY engagement_rate ASC, published_at DESC LIMIT 1) AS worst_post
+"""
+
+_BEST_HOURS_SQL = f"""
+    SELECT publish_hour FROM content_metrics WHERE {_SUMMARY_WHERE}
+    GROUP BY publish_hour
+    ORDER BY AVG(engagement_rate) DESC, MAX(published_at) DESC
+    LIMIT 3
+"""
+
+# Per-day aggregates kept in step with content_metrics by the triggers below,
+# so period totals read O(days) rollup rows instead of every post
+_DAILY_ROLLUP_DDL = """
+    CREATE TABLE IF NOT EXISTS daily_rollup (
+        user_id INTEGER NOT NULL,
+        platform TEXT NOT NULL,
+        date TEXT NOT NULL,
+        content_type TEXT NOT NULL,
+        posts INTEGER DEFAULT 0,
+        views INTEGER DEFAULT 0,
+        engagement INTEGER DEFAULT 0,
+        eng_rate_sum REAL DEFAULT 0.0,
+        PRIMARY KEY (user_id, platform, date, content_type)
+    )
+"""
+
+_ROLLUP_KEY = (
+    "user_id = {row}.user_id AND platform = {row}.platform "
+    "AND date = substr({row}.published_at, 1, 10) AND content_type = {row}.content_type"
+)
+
+_ROLLUP_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_daily_rollup_insert AFTER INSERT ON content_metrics
+    BEGIN
+        -- No conflict clause: the outer INSERT OR REPLACE would override it
+        INSERT INTO daily_rollup (user_id, platform, date, content_type)
+        SELECT NEW.user_id, NEW.platform, substr(NEW.published_at, 1, 10), NEW.content_type
+        WHERE NOT EXISTS (SELECT 1 FROM daily_rollup WHERE {_ROLLUP_KEY.format(row="NEW")});
+        UPDATE daily_rollup SET
+            posts = posts + 1,
+            views = views + NEW.views,
+            engagement = engagement + NEW.likes + NEW.comments + NEW.shares + NEW.saves,
+            eng_rate_sum = eng_rate_sum + NEW.engagement_rate
+        WHERE {_ROLLUP_KEY.format(row="NEW")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_daily_rollup_delete AFTER DELETE ON content_metrics
+    BEGIN
+        UPDATE daily_rollup SET
+            posts = posts - 1,
+            views = views - OLD.views,
+            engagement = engagement - (OLD.likes + OLD.comments + OLD.shares + OLD.saves),
+            eng_rate_sum = eng_rate_sum - OLD.engagement_rate
+        WHERE {_ROLLUP_KEY.format(row="OLD")};
+    END
+    """,
+)
+
+_ROLLUP_BACKFILL_SQL = """
+    INSERT INTO daily_rollup (user_id, platform, date, content_type, posts, views, engagement, eng_rate_sum)
+    SELECT user_id, platform, substr(published_at, 1, 10), content_type,
+           COUNT(*), SUM(views), SUM(likes + comments + shares + saves), SUM(engagement_rate)
+    FROM content_metrics
+    GROUP BY user_id, platform, substr(published_at, 1, 10), content_type
+"""
+
+_ROLLUP_SUMMARY_SQL = """
+    SELECT COALESCE(SUM(posts), 0) AS total_posts,
+           COALESCE(SUM(views), 0) AS total_views,
+           COALESCE(SUM(engagement), 0) AS total_engagement,
+           SUM(eng_rate_sum) / SUM(posts) AS avg_engagement_rate
+    FROM daily_rollup
+    WHERE user_id = :user_id AND platform = :platform AND date >= :start AND date <= :end_day
+"""
+
+_WINDOW_TOTALS_SQL = """
+    SELECT COUNT(*) AS posts,
+           COALESCE(SUM(views), 0) AS views,
+           COALESCE(SUM(likes), 0) AS likes,
+           COALESCE(SUM(comments), 0) AS comments,
+           COALESCE(SUM(shares), 0) AS shares,
+           COALESCE(SUM(saves), 0) AS saves
+    FROM content_metrics
+    WHERE user_id = ? AND published_at >= ? AND published_at <= ?
+"""
+
+def _empty_platform_summary(platform: str) -> PlatformSummary:
+    """Summary for a platform with no posts in the requested period"""
+    return PlatformSummary(
+        platform=platform,
+        total_posts=0,
+        total_views=0,
+        total_engagement=0,
+        avg_engagement_rate=0.0,
+        best_performing_post="",
+        worst_performing_post="",
+        best_posting_hours=[],
+        trending_hashtags=[]
+    )
+
+def _row_to_metrics(row: sqlite3.Row) -> ContentMetrics:
+    """Build ContentMetrics from a full content_metrics row"""
+    return ContentMetrics(**{column: row[column] for column in _METRICS_COLUMNS})
+
+def _metrics_to_row(metrics: ContentMetrics, now: Optional[str] = None) -> tuple:
+    """Fill in timestamps on metrics and return the values bound on insert"""
+    
+    if not _GENERATED_COLUMNS:
+        # Calculate engagement rate
+        total_engagement = metrics.likes + metrics.comments + metrics.shares + metrics.saves
+        metrics.engagement_rate = total_engagement / max(metrics.views, 1)
+        
+        # Calculate CTR
+        if metrics.impressions > 0:
+            metrics.ctr = metrics.clicks / metrics.impressions
+    
+    # Set timestamps
+    now = now or datetime.now(timezone.utc).isoformat()
+    if not metrics.collected_at:
+        metrics.collected_at = now
+    metrics.last_updated = now
+    
+    return _write_values(metrics)
+
 class MetricsCollector:
     """Collects and stores performance metrics from all platforms"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", batch_chunk: int = DEFAULT_BATCH_CHUNK):
         self.data_dir = Path(data_dir)
         self.db_path = self.data_dir / "metrics.db"
         self.exports_dir = self.data_dir / "exports"
         
+        # Connections are cached per thread; sqlite3 objects must not be shared
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # Blocking SQLite and export work runs here, off the event loop; each
+        # worker keeps its own connection and WAL lets their reads overlap
+        self._db_pool = ThreadPoolExecutor(max_workers=DB_POOL_WORKERS, thread_name_prefix="metrics-db")
+        
+        # Rows written per transaction by batch_store_metrics
+        self._batch_chunk = max(1, batch_chunk)
+        
+        # Short-lived read caches keyed by user_id: (stored_at, value)
+        self._platforms_cache: Dict[int, Tuple[float, List[str]]] = {}
+        self._realtime_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        
         # Create directories
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
-        asyncio.create_task(self._init_database())
+        # Initialize database before any read or write can reach it
+        self._initialized = self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's long-lived metrics database connection
+        
+        The connection is opened on first use with WAL journaling and tuned
+        pragmas, then reused so repeated queries skip the open and keep a
+        warm page cache. Rows support access by column name.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    async def _run_db(self, func: Callable[..., T], *args) -> T:
+        """Run a blocking database call on the collector's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_pool, func, *args)
+    
+    def close(self):
+        """Stop the database pool and close every connection opened by this collector"""
+        self._db_pool.shutdown(wait=True)
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
+    def _migrate_derived_columns(self, conn: sqlite3.Connection):
+        """Rebuild a content_metrics table whose engagement_rate and ctr are plain columns"""
+        
+        hidden = {row["name"]: row["hidden"] for row in conn.execute("PRAGMA table_xinfo(content_metrics)")}
+        if all(hidden.get(column) for column in _DERIVED_COLUMNS):
+            return
+        
+        copied = ", ".join(("id",) + _WRITE_COLUMNS)
+        conn.execute("BEGIN")
+        with conn:
+            conn.execute("ALTER TABLE content_metrics RENAME TO content_metrics_legacy")
+            conn.execute(_CONTENT_METRICS_DDL.format(if_not_exists="", table="content_metrics"))
+            conn.execute(
+                f"INSERT INTO content_metrics ({copied}) SELECT {copied} FROM content_metrics_legacy"
+            )
+            # Dropping the legacy table also drops its indexes; they are recreated after this
+            conn.execute("DROP TABLE content_metrics_legacy")
+        
+        logger.info("Migrated content_metrics to generated engagement_rate/ctr columns")
     
-    async def _init_database(self):
+    def _init_database(self) -> bool:
         """Initialize SQLite database for metrics storage"""
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Content metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS content_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    content_id TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    platform TEXT NOT NULL,
-                    content_type TEXT NOT NULL,
-                    post_id TEXT NOT NULL,
-                    post_url TEXT,
-                    published_at TEXT NOT NULL,
-                    views INTEGER DEFAULT 0,
-                    impressions INTEGER DEFAULT 0,
-                    reach INTEGER DEFAULT 0,
-                    likes INTEGER DEFAULT 0,
-                    comments INTEGER DEFAULT 0,
-                    shares INTEGER DEFAULT 0,
-                    saves INTEGER DEFAULT 0,
-                    clicks INTEGER DEFAULT 0,
-                    engagement_rate REAL DEFAULT 0.0,
-                    ctr REAL DEFAULT 0.0,
-                    completion_rate REAL DEFAULT 0.0,
-                    watch_time INTEGER DEFAULT 0,
-                    publish_hour INTEGER DEFAULT 0,
-                    publish_day_of_week INTEGER DEFAULT 0,
-                    caption_length INTEGER DEFAULT 0,
-                    hashtag_count INTEGER DEFAULT 0,
-                    duration REAL DEFAULT 0.0,
-                    file_size INTEGER DEFAULT 0,
-                    aspect_ratio TEXT DEFAULT "",
-                    collected_at TEXT NOT NULL,
-                    last_updated TEXT NOT NULL,
-                    UNIQUE(content_id, platform)
-                )
-            ''')
+            cursor.execute(_CONTENT_METRICS_DDL.format(if_not_exists="IF NOT EXISTS ", table="content_metrics"))
+            
+            if _GENERATED_COLUMNS:
+                self._migrate_derived_columns(conn)
+            
+            # Indexes backing the user/platform/date range reads and top-N queries
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cm_user_plat_pub "
+                "ON content_metrics(user_id, platform, published_at DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cm_user_pub "
+                "ON content_metrics(user_id, published_at DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cm_user_plat_engagement "
+                "ON content_metrics(user_id, platform, engagement_rate DESC)"
+            )
             
             # Platform summaries table
             cursor.execute('''
@@ -178,57 +513,39 @@ class MetricsCollector:
                 )
             ''')
             
+            # Daily rollup, maintained on every content_metrics write
+            cursor.execute(_DAILY_ROLLUP_DDL)
+            for trigger in _ROLLUP_TRIGGERS:
+                cursor.execute(trigger)
+            
             conn.commit()
-            conn.close()
+            
+            # Seed the rollup from rows stored before it existed
+            if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM daily_rollup)").fetchone()[0]:
+                with conn:
+                    conn.execute(_ROLLUP_BACKFILL_SQL)
             
             logger.info("Metrics database initialized successfully")
+            return True
             
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
+            return False
     
     async def store_metrics(self, metrics: ContentMetrics):
         """Store content metrics in database"""
+        return await self._run_db(self._sync_store_metrics, metrics)
+    
+    def _sync_store_metrics(self, metrics: ContentMetrics):
+        """Blocking body of store_metrics(), run on the database pool"""
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Calculate engagement rate
-            total_engagement = metrics.likes + metrics.comments + metrics.shares + metrics.saves
-            metrics.engagement_rate = total_engagement / max(metrics.views, 1)
-            
-            # Calculate CTR
-            if metrics.impressions > 0:
-                metrics.ctr = metrics.clicks / metrics.impressions
-            
-            # Set timestamps
-            now = datetime.now(timezone.utc).isoformat()
-            if not metrics.collected_at:
-                metrics.collected_at = now
-            metrics.last_updated = now
+            conn = self._connect()
             
             # Insert or update metrics
-            cursor.execute('''
-                INSERT OR REPLACE INTO content_metrics
-                (content_id, user_id, platform, content_type, post_id, post_url, published_at,
-                 views, impressions, reach, likes, comments, shares, saves, clicks,
-                 engagement_rate, ctr, completion_rate, watch_time,
-                 publish_hour, publish_day_of_week, caption_length, hashtag_count,
-                 duration, file_size, aspect_ratio, collected_at, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                metrics.content_id, metrics.user_id, metrics.platform, metrics.content_type,
-                metrics.post_id, metrics.post_url, metrics.published_at,
-                metrics.views, metrics.impressions, metrics.reach, metrics.likes,
-                metrics.comments, metrics.shares, metrics.saves, metrics.clicks,
-                metrics.engagement_rate, metrics.ctr, metrics.completion_rate, metrics.watch_time,
-                metrics.publish_hour, metrics.publish_day_of_week, metrics.caption_length,
-                metrics.hashtag_count, metrics.duration, metrics.file_size, metrics.aspect_ratio,
-                metrics.collected_at, metrics.last_updated
-            ))
-            
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(_INSERT_METRICS_SQL, _metrics_to_row(metrics))
+            self._invalidate_caches([metrics])
             
             logger.info(f"Stored metrics for {metrics.platform} post {metrics.post_id}")
             
@@ -236,25 +553,76 @@ class MetricsCollector:
             logger.error(f"Error storing metrics: {e}")
     
     async def batch_store_metrics(self, metrics_list: List[ContentMetrics]):
-        """Store multiple metrics efficiently"""
+        """Store multiple metrics in a single transaction"""
+        return await self._run_db(self._sync_batch_store_metrics, metrics_list)
+    
+    def _sync_batch_store_metrics(self, metrics_list: List[ContentMetrics]):
+        """Blocking body of batch_store_metrics(), run on the database pool"""
         
-        for metrics in metrics_list:
-            await self.store_metrics(metrics)
+        if not metrics_list:
+            return
+        
+        stored = 0
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            conn = self._connect()
+            
+            # Commit in chunks so a huge batch doesn't hold the write lock throughout
+            for start in range(0, len(metrics_list), self._batch_chunk):
+                chunk = metrics_list[start:start + self._batch_chunk]
+                with conn:
+                    conn.executemany(_INSERT_METRICS_SQL, [_metrics_to_row(m, now) for m in chunk])
+                stored += len(chunk)
+            
+            logger.info(f"Batch stored {stored} metrics")
+            
+        except Exception as e:
+            logger.error(f"Error batch storing metrics after {stored} of {len(metrics_list)}: {e}")
         
-        logger.info(f"Batch stored {len(metrics_list)} metrics")
+        finally:
+            self._invalidate_caches(metrics_list[:stored])
+    
+    def _invalidate_caches(self, metrics_list: List[ContentMetrics]):
+        """Drop cached reads that the stored metrics have made stale"""
+        for metrics in metrics_list:
+            self._realtime_cache.pop(metrics.user_id, None)
+            cached = self._platforms_cache.get(metrics.user_id)
+            if cached and metrics.platform not in cached[1]:
+                self._platforms_cache.pop(metrics.user_id, None)
     
     async def get_content_metrics(self, user_id: int, platform: str = None,
                                  start_date: str = None, end_date: str = None,
-                                 limit: int = 100) -> List[ContentMetrics]:
-        """Retrieve content metrics with filters"""
+                                 limit: int = 100,
+                                 columns: Optional[Sequence[str]] = None
+                                 ) -> Union[List[ContentMetrics], List[sqlite3.Row]]:
+        """Retrieve content metrics with filters
+        
+        When columns is given only those fields are selected and the raw
+        sqlite3.Row objects are returned instead of ContentMetrics.
+        """
+        return await self._run_db(
+            self._sync_get_content_metrics, user_id, platform, start_date, end_date, limit, columns
+        )
+    
+    def _sync_get_content_metrics(self, user_id: int, platform: str = None,
+                                 start_date: str = None, end_date: str = None,
+                                 limit: int = 100,
+                                 columns: Optional[Sequence[str]] = None
+                                 ) -> Union[List[ContentMetrics], List[sqlite3.Row]]:
+        """Blocking body of get_content_metrics(), run on the database pool"""
+        
+        if columns:
+            unknown = set(columns).difference(_METRICS_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown metrics columns: {sorted(unknown)}")
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Build query
-            query = "SELECT * FROM content_metrics WHERE user_id = ?"
+            projection = ", ".join(columns) if columns else "*"
+            query = f"SELECT {projection} FROM content_metrics WHERE user_id = ?"
             params = [user_id]
             
             if platform:
@@ -274,42 +642,12 @@ class MetricsCollector:
             
             cursor.execute(query, params)
             rows = cursor.fetchall()
-            conn.close()
+            
+            if columns:
+                return rows
             
             # Convert to ContentMetrics objects
-            metrics_list = []
-            for row in rows:
-                metrics = ContentMetrics(
-                    content_id=row["content_id"],
-                    user_id=row["user_id"],
-                    platform=row["platform"],
-                    content_type=row["content_type"],
-                    post_id=row["post_id"],
-                    post_url=row["post_url"],
-                    published_at=row["published_at"],
-                    views=row["views"],
-                    impressions=row["impressions"],
-                    reach=row["reach"],
-                    likes=row["likes"],
-                    comments=row["comments"],
-                    shares=row["shares"],
-                    saves=row["saves"],
-                    clicks=row["clicks"],
-                    engagement_rate=row["engagement_rate"],
-                    ctr=row["ctr"],
-                    completion_rate=row["completion_rate"],
-                    watch_time=row["watch_time"],
-                    publish_hour=row["publish_hour"],
-                    publish_day_of_week=row["publish_day_of_week"],
-                    caption_length=row["caption_length"],
-                    hashtag_count=row["hashtag_count"],
-                    duration=row["duration"],
-                    file_size=row["file_size"],
-                    aspect_ratio=row["aspect_ratio"],
-                    collected_at=row["collected_at"],
-                    last_updated=row["last_updated"]
-                )
-                metrics_list.append(metrics)
+            metrics_list = [_row_to_metrics(row) for row in rows]
             
             return metrics_list
             
@@ -320,91 +658,90 @@ class MetricsCollector:
     async def get_platform_summary(self, user_id: int, platform: str,
                                   days: int = 30) -> PlatformSummary:
         """Get platform performance summary"""
+        return await self._run_db(self._sync_get_platform_summary, user_id, platform, days)
+    
+    def _sync_get_platform_summary(self, user_id: int, platform: str,
+                                  days: int = 30) -> PlatformSummary:
+        """Blocking body of get_platform_summary(), run on the database pool"""
         
-        # Get metrics for the specified period
+        # Totals come from the daily rollup, so the period starts at midnight UTC
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        metrics = await self.get_content_metrics(
-            user_id, platform, 
-            start_date.isoformat(), 
-            end_date.isoformat(),
-            limit=1000
-        )
-        
-        if not metrics:
-            return PlatformSummary(
-                platform=platform,
-                total_posts=0,
-                total_views=0,
-                total_engagement=0,
-                avg_engagement_rate=0.0,
-                best_performing_post="",
-                worst_performing_post="",
-                best_posting_hours=[],
-                trending_hashtags=[]
-            )
-        
-        # Calculate summary statistics
-        total_posts = len(metrics)
-        total_views = sum(m.views for m in metrics)
-        total_engagement = sum(m.likes + m.comments + m.shares + m.saves for m in metrics)
-        avg_engagement_rate = statistics.mean(m.engagement_rate for m in metrics)
-        
-        # Find best and worst performing posts
-        best_post = max(metrics, key=lambda m: m.engagement_rate)
-        worst_post = min(metrics, key=lambda m: m.engagement_rate)
-        
-        # Find best posting hours
-        hour_performance = defaultdict(list)
-        for m in metrics:
-            hour_performance[m.publish_hour].append(m.engagement_rate)
-        
-        avg_hour_performance = {
-            hour: statistics.mean(rates)
-            for hour, rates in hour_performance.items()
+        params = {
+            "user_id": user_id,
+            "platform": platform,
+            "start": start_date.date().isoformat(),
+            "end": end_date.isoformat(),
+            "end_day": end_date.date().isoformat()
         }
         
-        best_hours = sorted(avg_hour_performance.items(), key=lambda x: x[1], reverse=True)[:3]
-        best_posting_hours = [hour for hour, _ in best_hours]
+        try:
+            conn = self._connect()
+            totals = conn.execute(_ROLLUP_SUMMARY_SQL, params).fetchone()
+            
+            if not totals["total_posts"]:
+                return _empty_platform_summary(platform)
+            
+            # Find best and worst performing posts
+            posts = conn.execute(_BEST_WORST_POSTS_SQL, params).fetchone()
+            
+            # Find best posting hours
+            best_posting_hours = [
+                row["publish_hour"] for row in conn.execute(_BEST_HOURS_SQL, params)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error summarizing {platform} metrics: {e}")
+            return _empty_platform_summary(platform)
         
         # Analyze hashtag trends (simplified)
-        hashtag_performance = defaultdict(list)
         trending_hashtags = ["trending1", "trending2", "trending3"]  # Placeholder
         
         return PlatformSummary(
             platform=platform,
-            total_posts=total_posts,
-            total_views=total_views,
-            total_engagement=total_engagement,
-            avg_engagement_rate=avg_engagement_rate,
-            best_performing_post=best_post.post_id,
-            worst_performing_post=worst_post.post_id,
+            total_posts=totals["total_posts"],
+            total_views=totals["total_views"],
+            total_engagement=totals["total_engagement"],
+            avg_engagement_rate=totals["avg_engagement_rate"],
+            best_performing_post=posts["best_post"],
+            worst_performing_post=posts["worst_post"],
             best_posting_hours=best_posting_hours,
             trending_hashtags=trending_hashtags
         )
     
+    async def _get_window_totals(self, user_id: int, start_date: str, end_date: str) -> Dict[str, int]:
+        """Sum post counts, views and engagement counters over a date window"""
+        return await self._run_db(self._sync_get_window_totals, user_id, start_date, end_date)
+    
+    def _sync_get_window_totals(self, user_id: int, start_date: str, end_date: str) -> Dict[str, int]:
+        """Blocking body of _get_window_totals(), run on the database pool"""
+        
+        try:
+            conn = self._connect()
+            row = conn.execute(_WINDOW_TOTALS_SQL, (user_id, start_date, end_date)).fetchone()
+            return dict(row)
+            
+        except Exception as e:
+            logger.error(f"Error summing metrics window: {e}")
+            return dict.fromkeys(("posts", "views", "likes", "comments", "shares", "saves"), 0)
+    
     async def generate_performance_report(self, user_id: int, days: int = 30) -> PerformanceReport:
         """Generate comprehensive performance report"""
         
         platforms = await self._get_user_platforms(user_id)
-        platform_summaries = []
         
-        # Get summaries for each platform
-        for platform in platforms:
-            summary = await self.get_platform_summary(user_id, platform, days)
-            platform_summaries.append(summary)
+        start_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
         
-        # Get top performers across all platforms
-        all_metrics = await self.get_content_metrics(
-            user_id, limit=1000,
-            start_date=(datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        # Platform summaries, top performers across all platforms, content type
+        # performance and growth are independent
+        summaries, top_performers, content_type_performance, growth_metrics = await asyncio.gather(
+            asyncio.gather(*(self.get_platform_summary(user_id, platform, days) for platform in platforms)),
+            self.get_top_performers(user_id, start_date, limit=10),
+            self._analyze_content_type_performance(user_id, start_date),
+            self._calculate_growth_metrics(user_id, days)
         )
-        
-        top_performers = sorted(all_metrics, key=lambda m: m.engagement_rate, reverse=True)[:10]
-        
-        # Calculate growth metrics
-        growth_metrics = await self._calculate_growth_metrics(user_id, days)
+        platform_summaries = list(summaries)
         
         # Generate recommendations
         recommendations = await self._generate_recommendations(user_id, platform_summaries)
@@ -423,9 +760,6 @@ class MetricsCollector:
         for summary in platform_summaries:
             optimal_times[summary.platform] = summary.best_posting_hours
         
-        # Content type performance
-        content_type_performance = await self._analyze_content_type_performance(all_metrics)
-        
         return PerformanceReport(
             user_id=user_id,
             report_period=f"Last {days} days",
@@ -439,11 +773,37 @@ class MetricsCollector:
             content_type_performance=content_type_performance
         )
     
+    async def get_top_performers(self, user_id: int, start_date: str,
+                                 limit: int = 10) -> List[ContentMetrics]:
+        """Get the highest-engagement posts published since start_date"""
+        return await self._run_db(self._sync_get_top_performers, user_id, start_date, limit)
+    
+    def _sync_get_top_performers(self, user_id: int, start_date: str,
+                                 limit: int = 10) -> List[ContentMetrics]:
+        """Blocking body of get_top_performers(), run on the database pool"""
+        
+        try:
+            conn = self._connect()
+            rows = conn.execute(_TOP_PERFORMERS_SQL, (user_id, start_date, limit)).fetchall()
+            return [_row_to_metrics(row) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Error retrieving top performers: {e}")
+            return []
+    
     async def _get_user_platforms(self, user_id: int) -> List[str]:
         """Get platforms used by user"""
+        return await self._run_db(self._sync_get_user_platforms, user_id)
+    
+    def _sync_get_user_platforms(self, user_id: int) -> List[str]:
+        """Blocking body of _get_user_platforms(), run on the database pool"""
+        
+        cached = self._platforms_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < PLATFORMS_CACHE_TTL:
+            return cached[1]
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             cursor.execute(
@@ -452,7 +812,7 @@ class MetricsCollector:
             )
             
             platforms = [row[0] for row in cursor.fetchall()]
-            conn.close()
+            self._platforms_cache[user_id] = (time.monotonic(), platforms)
             
             return platforms
             
@@ -460,35 +820,40 @@ class MetricsCollector:
             logger.error(f"Error getting user platforms: {e}")
             return []
     
+    async def _get_recent_by_platform(self, user_id: int, per_platform: int = 100) -> List[sqlite3.Row]:
+        """Get each platform's most recent posts, ordered by platform then recency"""
+        return await self._run_db(self._sync_get_recent_by_platform, user_id, per_platform)
+    
+    def _sync_get_recent_by_platform(self, user_id: int, per_platform: int = 100) -> List[sqlite3.Row]:
+        """Blocking body of _get_recent_by_platform(), run on the database pool"""
+        
+        try:
+            conn = self._connect()
+            return conn.execute(_RECENT_BY_PLATFORM_SQL, (user_id, per_platform)).fetchall()
+            
+        except Exception as e:
+            logger.error(f"Error getting recent metrics by platform: {e}")
+            return []
+    
     async def _calculate_growth_metrics(self, user_id: int, days: int) -> Dict[str, float]:
         """Calculate growth metrics"""
         
-        # Get current period metrics
+        # Current and previous period windows
         end_date = datetime.now(timezone.utc)
         current_start = end_date - timedelta(days=days)
-        
-        current_metrics = await self.get_content_metrics(
-            user_id, 
-            start_date=current_start.isoformat(),
-            end_date=end_date.isoformat(),
-            limit=1000
-        )
-        
-        # Get previous period metrics
         previous_start = current_start - timedelta(days=days)
-        previous_metrics = await self.get_content_metrics(
-            user_id,
-            start_date=previous_start.isoformat(), 
-            end_date=current_start.isoformat(),
-            limit=1000
+        
+        current, previous = await asyncio.gather(
+            self._get_window_totals(user_id, current_start.isoformat(), end_date.isoformat()),
+            self._get_window_totals(user_id, previous_start.isoformat(), current_start.isoformat())
         )
         
         # Calculate growth rates
-        current_views = sum(m.views for m in current_metrics)
-        previous_views = sum(m.views for m in previous_metrics) or 1
+        current_views = current["views"]
+        previous_views = previous["views"] or 1
         
-        current_engagement = sum(m.likes + m.comments + m.shares for m in current_metrics)
-        previous_engagement = sum(m.likes + m.comments + m.shares for m in previous_metrics) or 1
+        current_engagement = current["likes"] + current["comments"] + current["shares"]
+        previous_engagement = (previous["likes"] + previous["comments"] + previous["shares"]) or 1
         
         view_growth = ((current_views - previous_views) / previous_views) * 100
         engagement_growth = ((current_engagement - previous_engagement) / previous_engagement) * 100
@@ -496,9 +861,9 @@ class MetricsCollector:
         return {
             "view_growth_percent": round(view_growth, 2),
             "engagement_growth_percent": round(engagement_growth, 2),
-            "current_posts": len(current_metrics),
-            "previous_posts": len(previous_metrics),
-            "posting_frequency_change": len(current_metrics) - len(previous_metrics)
+            "current_posts": current["posts"],
+            "previous_posts": previous["posts"],
+            "posting_frequency_change": current["posts"] - previous["posts"]
         }
     
     async def _generate_recommendations(self, user_id: int, summaries: List[PlatformSummary]) -> List[str]:
@@ -512,7 +877,7 @@ class MetricsCollector:
             all_best_hours.extend(summary.best_posting_hours)
         
         if all_best_hours:
-            most_common_hour = max(set(all_best_hours), key=all_best_hours.count)
+            most_common_hour = Counter(all_best_hours).most_common(1)[0][0]
             recommendations.append(f"Your best posting time is {most_common_hour}:00. Consider scheduling more content at this hour.")
         
         # Platform performance recommendations
@@ -535,21 +900,30 @@ class MetricsCollector:
         
         return recommendations[:5]  # Return top 5 recommendations
     
-    async def _analyze_content_type_performance(self, metrics: List[ContentMetrics]) -> Dict[str, float]:
+    async def _analyze_content_type_performance(self, user_id: int, start_date: str) -> Dict[str, float]:
         """Analyze performance by content type"""
+        return await self._run_db(self._sync_analyze_content_type_performance, user_id, start_date)
+    
+    def _sync_analyze_content_type_performance(self, user_id: int, start_date: str) -> Dict[str, float]:
+        """Blocking body of _analyze_content_type_performance(), run on the database pool"""
         
-        content_performance = defaultdict(list)
-        
-        for m in metrics:
-            content_performance[m.content_type].append(m.engagement_rate)
-        
-        return {
-            content_type: statistics.mean(rates)
-            for content_type, rates in content_performance.items()
-        }
+        try:
+            conn = self._connect()
+            return {
+                row["content_type"]: row["avg_engagement_rate"]
+                for row in conn.execute(_CONTENT_TYPE_PERFORMANCE_SQL, (user_id, start_date))
+            }
+            
+        except Exception as e:
+            logger.error(f"Error analyzing content type performance: {e}")
+            return {}
     
     async def export_metrics_csv(self, user_id: int, filename: str = None) -> str:
         """Export metrics to CSV"""
+        return await self._run_db(self._sync_export_metrics_csv, user_id, filename)
+    
+    def _sync_export_metrics_csv(self, user_id: int, filename: str = None) -> str:
+        """Blocking body of export_metrics_csv(), run on the database pool"""
         
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -557,43 +931,32 @@ class MetricsCollector:
         
         export_path = self.exports_dir / filename
         
-        # Get all metrics for user
-        metrics = await self.get_content_metrics(user_id, limit=10000)
+        # Stream rows straight from SQLite into the CSV writer
+        conn = self._connect()
+        cursor = conn.execute(_CSV_EXPORT_SQL, (user_id, 10000))
+        cursor.arraysize = 1000
+        exported = 0
         
-        # Write to CSV
         with open(export_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'content_id', 'platform', 'content_type', 'post_id', 'published_at',
-                'views', 'likes', 'comments', 'shares', 'saves', 'engagement_rate',
-                'publish_hour', 'publish_day_of_week', 'duration'
-            ]
+            writer = csv.writer(csvfile)
+            writer.writerow(_CSV_EXPORT_COLUMNS)
             
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for m in metrics:
-                writer.writerow({
-                    'content_id': m.content_id,
-                    'platform': m.platform,
-                    'content_type': m.content_type,
-                    'post_id': m.post_id,
-                    'published_at': m.published_at,
-                    'views': m.views,
-                    'likes': m.likes,
-                    'comments': m.comments,
-                    'shares': m.shares,
-                    'saves': m.saves,
-                    'engagement_rate': m.engagement_rate,
-                    'publish_hour': m.publish_hour,
-                    'publish_day_of_week': m.publish_day_of_week,
-                    'duration': m.duration
-                })
-        
-        logger.info(f"Exported {len(metrics)} metrics to {export_path}")
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                writer.writerows(rows)
+                exported += len(rows)
+        
+        logger.info(f"Exported {exported} metrics to {export_path}")
         return str(export_path)
     
     async def export_report_json(self, report: PerformanceReport, filename: str = None) -> str:
         """Export performance report to JSON"""
+        return await self._run_db(self._sync_export_report_json, report, filename)
+    
+    def _sync_export_report_json(self, report: PerformanceReport, filename: str = None) -> str:
+        """Blocking body of export_report_json(), run on the database pool"""
         
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -601,11 +964,19 @@ class MetricsCollector:
         
         export_path = self.exports_dir / filename
         
-        # Convert to dict (handling dataclasses)
-        report_dict = asdict(report)
-        
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson serializes the nested dataclasses directly, no asdict() copy. The result
+            # parses to the same data as the json.dump branch, but the text can differ (json.dump
+            # writes 1e-05 where orjson writes 0.00001), so readers must parse it, not compare bytes
+            export_path.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            # Convert to dict (handling dataclasses)
+            report_dict = asdict(report)
+            
+            with open(export_path, 'w', encoding='utf-8') as f:
+                json.dump(report_dict, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Exported performance report to {export_path}")
         return str(export_path)
@@ -613,6 +984,10 @@ class MetricsCollector:
     async def get_real_time_metrics(self, user_id: int) -> Dict[str, Any]:
         """Get real-time dashboard metrics"""
         
+        cached = self._realtime_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < REALTIME_CACHE_TTL:
+            return cached[1]
+        
         # Get recent metrics (last 24 hours)
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=24)
@@ -620,30 +995,41 @@ class MetricsCollector:
         recent_metrics = await self.get_content_metrics(
             user_id,
             start_date=start_time.isoformat(),
-            end_date=end_time.isoformat()
+            end_date=end_time.isoformat(),
+            columns=_REALTIME_COLUMNS
         )
         
-        # Calculate real-time stats
-        total_views_24h = sum(m.views for m in recent_metrics)
-        total_engagement_24h = sum(m.likes + m.comments + m.shares for m in recent_metrics)
-        posts_24h = len(recent_metrics)
+        # Calculate real-time stats and the trending post (best in last 24h) in one pass
+        total_views_24h = 0
+        total_engagement_24h = 0
+        engagement_rate_sum = 0.0
+        trending_post = None
         
-        # Get trending post (best performing in last 24h)
-        trending_post = max(recent_metrics, key=lambda m: m.engagement_rate) if recent_metrics else None
+        for m in recent_metrics:
+            total_views_24h += m["views"]
+            total_engagement_24h += m["likes"] + m["comments"] + m["shares"]
+            engagement_rate_sum += m["engagement_rate"]
+            if trending_post is None or m["engagement_rate"] > trending_post["engagement_rate"]:
+                trending_post = m
         
-        return {
+        posts_24h = len(recent_metrics)
+        
+        realtime = {
             "views_24h": total_views_24h,
             "engagement_24h": total_engagement_24h,
             "posts_24h": posts_24h,
-            "avg_engagement_rate_24h": statistics.mean([m.engagement_rate for m in recent_metrics]) if recent_metrics else 0,
+            "avg_engagement_rate_24h": engagement_rate_sum / posts_24h if posts_24h else 0,
             "trending_post": {
-                "post_id": trending_post.post_id,
-                "platform": trending_post.platform,
-                "engagement_rate": trending_post.engagement_rate,
-                "views": trending_post.views
+                "post_id": trending_post["post_id"],
+                "platform": trending_post["platform"],
+                "engagement_rate": trending_post["engagement_rate"],
+                "views": trending_post["views"]
             } if trending_post else None,
             "last_updated": datetime.now(timezone.utc).isoformat()
         }
+        
+        self._realtime_cache[user_id] = (time.monotonic(), realtime)
+        return realtime
 
 # Analytics Dashboard Data Provider
 class AnalyticsDashboard:
@@ -655,17 +1041,13 @@ class AnalyticsDashboard:
     async def get_dashboard_data(self, user_id: int) -> Dict[str, Any]:
         """Get complete dashboard data"""
         
-        # Get performance report for last 30 days
-        report = await self.collector.generate_performance_report(user_id, 30)
-        
-        # Get real-time metrics
-        realtime = await self.collector.get_real_time_metrics(user_id)
-        
-        # Get weekly comparison
-        weekly_comparison = await self._get_weekly_comparison(user_id)
-        
-        # Get platform breakdown
-        platform_breakdown = await self._get_platform_breakdown(user_id)
+        # 30-day report, real-time metrics, weekly comparison and platform breakdown
+        report, realtime, weekly_comparison, platform_breakdown = await asyncio.gather(
+            self.collector.generate_performance_report(user_id, 30),
+            self.collector.get_real_time_metrics(user_id),
+            self._get_weekly_comparison(user_id),
+            self._get_platform_breakdown(user_id)
+        )
         
         return {
             "user_id": user_id,
@@ -680,65 +1062,67 @@ class AnalyticsDashboard:
     async def _get_weekly_comparison(self, user_id: int) -> Dict[str, Any]:
         """Get week-over-week comparison"""
         
-        # Current week
+        # Current and previous week windows
         end_date = datetime.now(timezone.utc)
         current_week_start = end_date - timedelta(days=7)
-        
-        current_week = await self.collector.get_content_metrics(
-            user_id,
-            start_date=current_week_start.isoformat(),
-            end_date=end_date.isoformat()
-        )
-        
-        # Previous week  
         previous_week_start = current_week_start - timedelta(days=7)
-        previous_week = await self.collector.get_content_metrics(
-            user_id,
-            start_date=previous_week_start.isoformat(),
-            end_date=current_week_start.isoformat()
+        
+        current_week, previous_week = await asyncio.gather(
+            self.collector._get_window_totals(
+                user_id, current_week_start.isoformat(), end_date.isoformat()
+            ),
+            self.collector._get_window_totals(
+                user_id, previous_week_start.isoformat(), current_week_start.isoformat()
+            )
         )
         
         # Calculate comparison
-        current_views = sum(m.views for m in current_week)
-        previous_views = sum(m.views for m in previous_week) or 1
+        current_views = current_week["views"]
+        previous_views = previous_week["views"] or 1
         
-        current_engagement = sum(m.likes + m.comments for m in current_week)
-        previous_engagement = sum(m.likes + m.comments for m in previous_week) or 1
+        current_engagement = current_week["likes"] + current_week["comments"]
+        previous_engagement = (previous_week["likes"] + previous_week["comments"]) or 1
         
         return {
             "views_change_percent": round(((current_views - previous_views) / previous_views) * 100, 2),
             "engagement_change_percent": round(((current_engagement - previous_engagement) / previous_engagement) * 100, 2),
-            "posts_this_week": len(current_week),
-            "posts_last_week": len(previous_week)
+            "posts_this_week": current_week["posts"],
+            "posts_last_week": previous_week["posts"]
         }
     
     async def _get_platform_breakdown(self, user_id: int) -> Dict[str, Dict[str, Any]]:
         """Get detailed platform breakdown"""
         
-        platforms = await self.collector._get_user_platforms(user_id)
+        # Latest 100 posts of every platform in one query, grouped by platform
+        rows = await self.collector._get_recent_by_platform(user_id, per_platform=100)
         breakdown = {}
         
-        for platform in platforms:
-            metrics = await self.collector.get_content_metrics(user_id, platform, limit=100)
-            
-            if metrics:
-                breakdown[platform] = {
-                    "total_posts": len(metrics),
-                    "total_views": sum(m.views for m in metrics),
-                    "avg_engagement_rate": statistics.mean([m.engagement_rate for m in metrics]),
-                    "best_content_type": max(
-                        set(m.content_type for m in metrics),
-                        key=lambda ct: statistics.mean([m.engagement_rate for m in metrics if m.content_type == ct])
-                    ),
-                    "recent_performance": [
-                        {
-                            "date": m.published_at[:10],
-                            "engagement_rate": m.engagement_rate,
-                            "views": m.views
-                        }
-                        for m in metrics[:7]  # Last 7 posts
-                    ]
-                }
+        for platform, group in itertools.groupby(rows, key=lambda row: row["platform"]):
+            metrics = list(group)
+            
+            # One grouped pass for the per-type means behind best_content_type
+            sum_by_type: Dict[str, float] = defaultdict(float)
+            count_by_type: Dict[str, int] = defaultdict(int)
+            for m in metrics:
+                sum_by_type[m["content_type"]] += m["engagement_rate"]
+                count_by_type[m["content_type"]] += 1
+            
+            breakdown[platform] = {
+                "total_posts": len(metrics),
+                "total_views": sum(m["views"] for m in metrics),
+                "avg_engagement_rate": sum(sum_by_type.values()) / len(metrics),
+                "best_content_type": max(
+                    sum_by_type, key=lambda ct: sum_by_type[ct] / count_by_type[ct]
+                ),
+                "recent_performance": [
+                    {
+                        "date": m["published_at"][:10],
+                        "engagement_rate": m["engagement_rate"],
+                        "views": m["views"]
+                    }
+                    for m in metrics[:7]  # Last 7 posts
+                ]
+            }
         
         return breakdown
 
@@ -8,16 +8,63 @@ import os
 import asyncio
 import subprocess
 import json
-import wave
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Sample rate audio is decoded at for waveform analysis
+WAVEFORM_SAMPLE_RATE = 22050
+
+# Number of trailing amplitudes shown by the bars waveform style
+WAVEFORM_BARS = 60
+
+# Frames each render worker may have queued ahead of the encoder
+FRAMES_IN_FLIGHT_PER_WORKER = 4
+
+# Frame canvases shared between the render thread and the encoder writer
+FRAME_BUFFERS = 4
+
+# Per-process state of frame render workers, set up by _init_frame_worker
+_frame_worker: Dict[str, Any] = {}
+
+def _init_frame_worker(temp_dir: str, output_dir: str, waveform_data: np.ndarray,
+                       config: "AudiogramConfig", title: str,
+                       max_amplitude: float, duration: float):
+    """Prepare a render worker: its own processor and the static frame layer"""
+    
+    processor = AudioProcessor(temp_dir, output_dir, frame_workers=1)
+    background = processor._render_background(config, title)
+    _frame_worker.update(
+        processor=processor,
+        waveform_data=waveform_data,
+        bar_windows=processor._bar_windows(waveform_data),
+        background=background,
+        canvas=np.empty_like(background),
+        config=config,
+        max_amplitude=max_amplitude,
+        duration=duration
+    )
+
+def _render_frame_in_worker(frame_idx: int) -> bytes:
+    """Render one audiogram frame inside a worker process"""
+    
+    state = _frame_worker
+    state["processor"]._render_frame(
+        frame_idx, state["waveform_data"], state["bar_windows"], state["background"],
+        state["canvas"], state["config"], state["max_amplitude"], state["duration"]
+    )
+    return state["canvas"].tobytes()
+
 @dataclass
 class AudioInfo:
     """Audio metadata information"""
@@ -28,7 +75,7 @@ class AudioInfo:
     format: str
     file_size: int
 
-@dataclass
+@dataclass(frozen=True)
 class AudiogramConfig:
     """Audiogram visual configuration"""
     width: int = 1080
@@ -41,13 +88,59 @@ class AudiogramConfig:
     waveform_style: str = "bars"  # bars, line, circle
     show_progress: bool = True
     show_title: bool = True
+    encoder_tune: Optional[str] = "animation"  # x264 tune, None to disable
+    keyframe_interval: int = 10  # seconds between keyframes
+
+# Shared, immutable per-platform defaults; customize with dataclasses.replace
+_PLATFORM_AUDIOGRAM_CONFIGS: Dict[str, AudiogramConfig] = {
+    "instagram": AudiogramConfig(
+        width=1080, height=1920,
+        background_color="#E1306C",
+        waveform_color="#FFFFFF"
+    ),
+    "instagram_post": AudiogramConfig(
+        width=1080, height=1080,
+        background_color="#E1306C", 
+        waveform_color="#FFFFFF"
+    ),
+    "twitter": AudiogramConfig(
+        width=1200, height=675,
+        background_color="#1DA1F2",
+        waveform_color="#FFFFFF"
+    ),
+    "linkedin": AudiogramConfig(
+        width=1200, height=628,
+        background_color="#0077B5",
+        waveform_color="#FFFFFF"
+    ),
+    "podcast": AudiogramConfig(
+        width=1080, height=1920,
+        background_color="#2C3E50",
+        waveform_color="#3498DB",
+        show_title=True
+    ),
+    "music": AudiogramConfig(
+        width=1920, height=1080,
+        background_color="#000000",
+        waveform_color="#FF6B6B",
+        waveform_style="spectrum"
+    )
+}
 
 class AudioProcessor:
     """Advanced audio processing with visualization"""
     
-    def __init__(self, temp_dir: str = "temp", output_dir: str = "data/content"):
+    def __init__(self, temp_dir: str = "temp", output_dir: str = "data/content",
+                 frame_workers: int = 1, encoder_threads: int = 0):
         self.temp_dir = Path(temp_dir)
         self.output_dir = Path(output_dir)
+        # Render worker processes are opt-in: shipping each full frame back through the
+        # pool pipe usually costs more than rendering it in-process
+        self.frame_workers = max(1, frame_workers)
+        self.encoder_threads = encoder_threads  # 0 lets ffmpeg decide
+        self._encode_semaphore: Optional[asyncio.Semaphore] = None
+        self._font_cache: Dict[int, ImageFont.ImageFont] = {}
+        self._timestamp_rows: Optional[Tuple[Tuple, np.ndarray]] = None
         
         for dir_path in [self.temp_dir, self.output_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
@@ -110,25 +203,37 @@ class AudioProcessor:
         # Extract audio waveform data
         waveform_data = await self._extract_waveform_data(audio_path, config.fps)
         
-        # Generate video frames
-        frames_dir = self.temp_dir / f"frames_{content_id}"
-        frames_dir.mkdir(exist_ok=True)
-        
-        await self._generate_audiogram_frames(
-            waveform_data, frames_dir, config, title, audio_info
+        return await self._render_audiogram(
+            audio_path, waveform_data, audio_info.duration, config, title,
+            platform, user_id, content_id
         )
+    
+    async def _render_audiogram(self, audio_path: str, waveform_data: np.ndarray,
+                                duration: float, config: AudiogramConfig, title: str,
+                                platform: str, user_id: int, content_id: str) -> str:
+        """Render frames for prepared waveform data and mux them with the audio"""
         
-        # Create video from frames and audio
         output_name = f"{content_id}_audiogram_{platform}.mp4"
         output_path = self.output_dir / str(user_id) / "audiograms" / output_name
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        await self._create_video_from_frames(
-            str(frames_dir), audio_path, str(output_path), config.fps
-        )
-        
-        # Cleanup frames
-        await self._cleanup_frames(frames_dir)
+        async with self._get_encode_semaphore():
+            # Stream raw frames straight into the encoder
+            encoder = await self._open_video_encoder(audio_path, str(output_path), config)
+            
+            try:
+                await self._generate_audiogram_frames(
+                    waveform_data, encoder, config, title, duration
+                )
+            except (BrokenPipeError, ConnectionResetError):
+                # Encoder exited early; its stderr is reported below
+                pass
+            except BaseException:
+                encoder.kill()
+                await encoder.wait()
+                raise
+            
+            await self._close_video_encoder(encoder, timeout=300)
         
         return str(output_path)
     
@@ -145,24 +250,23 @@ class AudioProcessor:
         segments = []
         segment_duration = min(segment_length, audio_info.duration / num_segments)
         
+        # One ffmpeg run with an output per segment shares the demux pass
+        cmd = ["ffmpeg", "-i", audio_path, "-y"]
+        
         for i in range(num_segments):
             start_time = i * (audio_info.duration / num_segments)
-            end_time = start_time + segment_duration
-            
             segment_path = self.temp_dir / f"segment_{i}_{os.path.basename(audio_path)}"
             
-            # Extract segment
-            cmd = [
-                "ffmpeg", "-i", audio_path, "-y",
+            cmd += [
                 "-ss", str(start_time),
                 "-t", str(segment_duration),
                 "-c", "copy",
                 str(segment_path)
             ]
-            
-            await self._run_command(cmd)
             segments.append(str(segment_path))
         
+        await self._run_command(cmd)
+        
         return segments
     
     async def transcribe_audio(self, audio_path: str, language: str = "auto") -> str:
@@ -182,20 +286,6 @@ class AudioProcessor:
                                 user_id: int = 0, content_id: str = "") -> str:
         """Create podcast clip with speaker identification"""
         
-        # Extract audio segment
-        segment_path = self.temp_dir / f"podcast_segment_{content_id}.wav"
-        
-        cmd = [
-            "ffmpeg", "-i", audio_path, "-y",
-            "-ss", str(start_time),
-            "-t", str(duration),
-            "-ac", "2",  # Stereo
-            "-ar", "44100",  # Sample rate
-            str(segment_path)
-        ]
-        
-        await self._run_command(cmd)
-        
         # Create audiogram for the segment
         config = AudiogramConfig(
             width=1080, height=1920,
@@ -210,9 +300,38 @@ class AudioProcessor:
         if speaker_names:
             title = f"{title}\n🎙️ {', '.join(speaker_names)}"
         
-        return await self.create_audiogram(
-            str(segment_path), "podcast", user_id, content_id, title, config
-        )
+        # Staged audio is only needed until the clip is muxed
+        with tempfile.TemporaryDirectory(prefix="podcast_", dir=self.temp_dir) as staging_dir:
+            # Decode the segment once: mono PCM on stdout for the waveform,
+            # and the stereo track the clip is muxed with
+            segment_path = Path(staging_dir) / f"segment_{content_id}.wav"
+            
+            cmd = [
+                "ffmpeg", "-y",
+                "-ss", str(start_time),
+                "-t", str(duration),
+                "-i", audio_path,
+                "-filter_complex", "[0:a]asplit=2[pcm][clip]",
+                "-map", "[pcm]",
+                "-ac", "1",
+                "-ar", str(WAVEFORM_SAMPLE_RATE),
+                "-f", "s16le",
+                "pipe:1",
+                "-map", "[clip]",
+                "-ac", "2",  # Stereo
+                "-ar", "44100",  # Sample rate
+                str(segment_path)
+            ]
+            
+            result = await self._run_command(cmd, decode_stdout=False)
+            audio_data = np.frombuffer(result.stdout, dtype=np.int16)
+            
+            waveform_data = self._compute_waveform(audio_data, config.fps)
+            
+            return await self._render_audiogram(
+                str(segment_path), waveform_data, len(audio_data) / WAVEFORM_SAMPLE_RATE,
+                config, title, "podcast", user_id, content_id
+            )
     
     async def create_music_visualization(self, audio_path: str, style: str = "spectrum",
                                        user_id: int = 0, content_id: str = "") -> str:
@@ -235,158 +354,238 @@ class AudioProcessor:
     def _get_platform_audiogram_config(self, platform: str) -> AudiogramConfig:
         """Get platform-specific audiogram configuration"""
         
-        configs = {
-            "instagram": AudiogramConfig(
-                width=1080, height=1920,
-                background_color="#E1306C",
-                waveform_color="#FFFFFF"
-            ),
-            "instagram_post": AudiogramConfig(
-                width=1080, height=1080,
-                background_color="#E1306C", 
-                waveform_color="#FFFFFF"
-            ),
-            "twitter": AudiogramConfig(
-                width=1200, height=675,
-                background_color="#1DA1F2",
-                waveform_color="#FFFFFF"
-            ),
-            "linkedin": AudiogramConfig(
-                width=1200, height=628,
-                background_color="#0077B5",
-                waveform_color="#FFFFFF"
-            ),
-            "podcast": AudiogramConfig(
-                width=1080, height=1920,
-                background_color="#2C3E50",
-                waveform_color="#3498DB",
-                show_title=True
-            ),
-            "music": AudiogramConfig(
-                width=1920, height=1080,
-                background_color="#000000",
-                waveform_color="#FF6B6B",
-                waveform_style="spectrum"
-            )
-        }
-        
-        return configs.get(platform, configs["instagram"])
+        return _PLATFORM_AUDIOGRAM_CONFIGS.get(platform, _PLATFORM_AUDIOGRAM_CONFIGS["instagram"])
     
     def _customize_audiogram_config(self, config: AudiogramConfig, brand_config: Dict) -> AudiogramConfig:
         """Customize audiogram with brand colors"""
         
+        changes = {}
+        
         if "primary_color" in brand_config:
-            config.background_color = brand_config["primary_color"]
+            changes["background_color"] = brand_config["primary_color"]
         
         if "secondary_color" in brand_config:
-            config.waveform_color = brand_config["secondary_color"]
+            changes["waveform_color"] = brand_config["secondary_color"]
         
         if "accent_color" in brand_config:
-            config.accent_color = brand_config["accent_color"]
+            changes["accent_color"] = brand_config["accent_color"]
         
-        return config
+        return replace(config, **changes)
     
     async def _extract_waveform_data(self, audio_path: str, fps: int) -> np.ndarray:
         """Extract waveform data for visualization"""
         
-        # Convert audio to raw format for processing
-        raw_path = self.temp_dir / "temp_audio.wav"
-        
+        # Decode straight to raw 16-bit PCM on stdout
         cmd = [
-            "ffmpeg", "-i", audio_path, "-y",
+            "ffmpeg", "-i", audio_path,
             "-ac", "1",  # Mono
-            "-ar", "22050",  # Lower sample rate for processing
-            "-f", "wav",
-            str(raw_path)
+            "-ar", str(WAVEFORM_SAMPLE_RATE),
+            "-f", "s16le",
+            "-"
         ]
         
-        await self._run_command(cmd)
+        result = await self._run_command(cmd, decode_stdout=False)
         
-        # Read WAV data
-        try:
-            with wave.open(str(raw_path), 'rb') as wav_file:
-                frames = wav_file.readframes(-1)
-                sample_rate = wav_file.getframerate()
-                audio_data = np.frombuffer(frames, dtype=np.int16)
-        except Exception as e:
-            logger.error(f"Error reading WAV data: {e}")
-            # Generate dummy data
-            duration = 30  # seconds
-            sample_rate = 22050
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            audio_data = (np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+        audio_data = np.frombuffer(result.stdout, dtype=np.int16)
+        
+        return self._compute_waveform(audio_data, fps)
+    
+    def _compute_waveform(self, audio_data: np.ndarray, fps: int) -> np.ndarray:
+        """Reduce mono PCM samples to one RMS amplitude per video frame"""
+        
+        sample_rate = WAVEFORM_SAMPLE_RATE
+        
+        if len(audio_data) * fps < sample_rate:
+            raise ValueError(f"Audio is shorter than one frame at {fps} fps ({len(audio_data)} samples)")
         
         # Downsample for visualization frames
         samples_per_frame = len(audio_data) // (fps * len(audio_data) // sample_rate)
         if samples_per_frame == 0:
             samples_per_frame = 1
         
-        # Calculate RMS values for each frame
+        # Calculate RMS (Root Mean Square) amplitude for each frame in one pass
         num_frames = len(audio_data) // samples_per_frame
-        waveform_data = []
+        frames = audio_data[:num_frames * samples_per_frame].reshape(
+            num_frames, samples_per_frame
+        ).astype(np.float32)
         
-        for i in range(num_frames):
-            start_idx = i * samples_per_frame
-            end_idx = start_idx + samples_per_frame
-            frame_data = audio_data[start_idx:end_idx]
-            
-            # Calculate RMS (Root Mean Square) for amplitude
-            rms = np.sqrt(np.mean(frame_data.astype(np.float64) ** 2))
-            waveform_data.append(rms)
+        waveform_data = np.einsum("ij,ij->i", frames, frames)
+        np.sqrt(waveform_data * (1.0 / samples_per_frame), out=waveform_data)
         
-        return np.array(waveform_data)
+        return waveform_data
     
     async def _generate_audiogram_frames(self, waveform_data: np.ndarray, 
-                                       frames_dir: Path, config: AudiogramConfig,
-                                       title: str, audio_info: AudioInfo):
-        """Generate individual frames for audiogram video"""
+                                       encoder: asyncio.subprocess.Process,
+                                       config: AudiogramConfig,
+                                       title: str, duration: float):
+        """Generate audiogram frames and pipe them to the encoder as raw RGB"""
         
         total_frames = len(waveform_data)
         max_amplitude = np.max(waveform_data) if len(waveform_data) > 0 else 1
         
-        for frame_idx in range(total_frames):
-            img = Image.new("RGB", (config.width, config.height), config.background_color)
-            draw = ImageDraw.Draw(img)
-            
-            # Draw title
-            if config.show_title and title:
-                await self._draw_title(draw, title, config)
-            
-            # Draw waveform
-            await self._draw_waveform(
-                draw, waveform_data[:frame_idx + 1], config, max_amplitude
+        if self.frame_workers > 1 and total_frames > 1:
+            await self._generate_frames_parallel(
+                waveform_data, encoder, config, title, duration, max_amplitude
+            )
+        else:
+            await self._generate_frames_pipelined(
+                waveform_data, encoder, config, title, duration, max_amplitude
             )
-            
-            # Draw progress bar
-            if config.show_progress:
-                progress = (frame_idx + 1) / total_frames
-                await self._draw_progress_bar(draw, progress, config)
-            
-            # Draw timestamp
-            current_time = (frame_idx + 1) / config.fps
-            await self._draw_timestamp(draw, current_time, audio_info.duration, config)
-            
-            # Save frame
-            frame_path = frames_dir / f"frame_{frame_idx:06d}.png"
-            img.save(str(frame_path), "PNG")
         
         logger.info(f"Generated {total_frames} frames for audiogram")
     
-    async def _draw_title(self, draw: ImageDraw.Draw, title: str, config: AudiogramConfig):
+    async def _generate_frames_pipelined(self, waveform_data: np.ndarray,
+                                         encoder: asyncio.subprocess.Process,
+                                         config: AudiogramConfig, title: str,
+                                         duration: float, max_amplitude: float):
+        """Render frames on a thread while the event loop feeds finished ones to the encoder"""
+        
+        loop = asyncio.get_running_loop()
+        background = self._render_background(config, title)
+        bar_windows = self._bar_windows(waveform_data)
+        total_frames = len(waveform_data)
+        
+        # Canvases cycle between the render thread and the writer
+        free_canvases: asyncio.Queue = asyncio.Queue()
+        ready_canvases: asyncio.Queue = asyncio.Queue()
+        for _ in range(FRAME_BUFFERS):
+            free_canvases.put_nowait(np.empty_like(background))
+        
+        async def render_frames():
+            try:
+                for frame_idx in range(total_frames):
+                    canvas = await free_canvases.get()
+                    await loop.run_in_executor(
+                        None, self._render_frame, frame_idx, waveform_data, bar_windows,
+                        background, canvas, config, max_amplitude, duration
+                    )
+                    ready_canvases.put_nowait(canvas)
+            except Exception as e:
+                ready_canvases.put_nowait(e)
+        
+        # Frames are written straight from the canvas; drain() must wait
+        # until each has fully left the transport before it is reused
+        encoder.stdin.transport.set_write_buffer_limits(high=0)
+        
+        renderer = asyncio.ensure_future(render_frames())
+        try:
+            for _ in range(total_frames):
+                canvas = await ready_canvases.get()
+                if isinstance(canvas, Exception):
+                    raise canvas
+                
+                encoder.stdin.write(memoryview(canvas).cast("B"))
+                await encoder.stdin.drain()
+                free_canvases.put_nowait(canvas)
+        finally:
+            renderer.cancel()
+    
+    async def _generate_frames_parallel(self, waveform_data: np.ndarray,
+                                        encoder: asyncio.subprocess.Process,
+                                        config: AudiogramConfig, title: str,
+                                        duration: float, max_amplitude: float):
+        """Render frames across worker processes, writing them to the encoder in order"""
+        
+        loop = asyncio.get_running_loop()
+        window = self.frame_workers * FRAMES_IN_FLIGHT_PER_WORKER
+        pending = deque()
+        
+        # Spawn rather than fork: this process runs an event loop and other thread pools
+        pool = ProcessPoolExecutor(
+            max_workers=self.frame_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_frame_worker,
+            initargs=(str(self.temp_dir), str(self.output_dir), waveform_data,
+                      config, title, max_amplitude, duration)
+        )
+        try:
+            for frame_idx in range(len(waveform_data)):
+                pending.append(
+                    loop.run_in_executor(pool, _render_frame_in_worker, frame_idx)
+                )
+                
+                # Bound frames held in memory ahead of the encoder
+                if len(pending) >= window:
+                    encoder.stdin.write(await pending.popleft())
+                    await encoder.stdin.drain()
+            
+            while pending:
+                encoder.stdin.write(await pending.popleft())
+                await encoder.stdin.drain()
+        finally:
+            for future in pending:
+                future.cancel()
+            # Joining the workers blocks, so do it off the event loop
+            await loop.run_in_executor(None, pool.shutdown)
+    
+    def _render_background(self, config: AudiogramConfig, title: str) -> np.ndarray:
+        """Render the layer shared by every frame: background, title and progress track"""
+        
+        background = Image.new("RGB", (config.width, config.height), config.background_color)
+        draw = ImageDraw.Draw(background)
+        
+        if config.show_title and title:
+            self._draw_title(draw, title, config)
+        
+        if config.show_progress:
+            self._draw_progress_track(draw, config)
+        
+        return np.array(background)
+    
+    def _bar_windows(self, waveform_data: np.ndarray) -> np.ndarray:
+        """View the trailing WAVEFORM_BARS amplitudes of every frame as one (frames, bars) array"""
+        
+        # Leading silence keeps the bar layout fixed before enough history exists
+        padded = np.concatenate([
+            np.zeros(WAVEFORM_BARS - 1, dtype=waveform_data.dtype), waveform_data
+        ])
+        return np.lib.stride_tricks.sliding_window_view(padded, WAVEFORM_BARS)
+    
+    def _render_frame(self, frame_idx: int, waveform_data: np.ndarray,
+                      bar_windows: np.ndarray, background: np.ndarray,
+                      canvas: np.ndarray, config: AudiogramConfig,
+                      max_amplitude: float, duration: float):
+        """Render a single frame into the reused canvas"""
+        
+        np.copyto(canvas, background)
+        
+        # Draw waveform
+        if config.waveform_style == "bars":
+            self._draw_waveform(canvas, bar_windows[frame_idx], config, max_amplitude)
+        else:
+            self._draw_waveform(
+                canvas, waveform_data[:frame_idx + 1], config, max_amplitude
+            )
+        
+        # Draw progress bar
+        if config.show_progress:
+            progress = (frame_idx + 1) / len(waveform_data)
+            self._draw_progress_bar(canvas, progress, config)
+        
+        # Draw timestamp
+        current_time = (frame_idx + 1) / config.fps
+        self._draw_timestamp(canvas, current_time, duration, config)
+    
+    @contextmanager
+    def _draw_rows(self, canvas: np.ndarray, top: int, bottom: int) -> Iterator[ImageDraw.ImageDraw]:
+        """Draw with PIL on canvas rows top:bottom, writing them back on exit"""
+        
+        band = Image.fromarray(canvas[top:bottom])
+        yield ImageDraw.Draw(band)
+        canvas[top:bottom] = np.asarray(band)
+    
+    def _draw_title(self, draw: ImageDraw.Draw, title: str, config: AudiogramConfig):
         """Draw title text on frame"""
         
         # Calculate title area
         title_area_height = config.height // 4
         margin = 40
         
-        try:
-            font_size = 48 if config.width >= 1080 else 36
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+        font_size = 48 if config.width >= 1080 else 36
+        font = self._get_font(font_size)
         
         # Word wrap title
-        lines = self._wrap_text(title, font, config.width - 2 * margin, draw)
+        lines = self._wrap_text(title, font, config.width - 2 * margin)
         
         # Center text vertically in title area
         line_height = font_size + 10
@@ -394,14 +593,13 @@ class AudioProcessor:
         start_y = (title_area_height - total_text_height) // 2
         
         for i, line in enumerate(lines):
-            bbox = draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
+            text_width = int(font.getlength(line))
             x = (config.width - text_width) // 2
             y = start_y + i * line_height
             
             draw.text((x, y), line, font=font, fill=config.text_color)
     
-    async def _draw_waveform(self, draw: ImageDraw.Draw, waveform_data: np.ndarray,
+    def _draw_waveform(self, canvas: np.ndarray, waveform_data: np.ndarray,
                            config: AudiogramConfig, max_amplitude: float):
         """Draw waveform visualization"""
         
@@ -414,54 +612,59 @@ class AudioProcessor:
         waveform_center = waveform_top + waveform_height // 2
         
         if config.waveform_style == "bars":
-            await self._draw_bars_waveform(
-                draw, waveform_data, config, max_amplitude, 
+            self._draw_bars_waveform(
+                canvas, waveform_data, config, max_amplitude, 
                 waveform_top, waveform_height, waveform_center
             )
         elif config.waveform_style == "line":
-            await self._draw_line_waveform(
-                draw, waveform_data, config, max_amplitude,
+            self._draw_line_waveform(
+                canvas, waveform_data, config, max_amplitude,
                 waveform_top, waveform_height, waveform_center
             )
         elif config.waveform_style == "circle":
-            await self._draw_circle_waveform(
-                draw, waveform_data, config, max_amplitude
+            self._draw_circle_waveform(
+                canvas, waveform_data, config, max_amplitude
             )
     
-    async def _draw_bars_waveform(self, draw: ImageDraw.Draw, waveform_data: np.ndarray,
+    def _draw_bars_waveform(self, canvas: np.ndarray, waveform_data: np.ndarray,
                                 config: AudiogramConfig, max_amplitude: float,
                                 waveform_top: int, waveform_height: int, waveform_center: int):
-        """Draw bars-style waveform"""
+        """Draw bars-style waveform from one frame's window of recent amplitudes"""
         
-        num_bars = min(len(waveform_data), 60)  # Max 60 bars
+        num_bars = len(waveform_data)
         bar_width = (config.width - 100) // num_bars
         bar_spacing = 2
         
-        # Show recent data (sliding window)
-        start_idx = max(0, len(waveform_data) - num_bars)
-        recent_data = waveform_data[start_idx:]
+        if max_amplitude > 0:
+            normalized = waveform_data / max_amplitude
+        else:
+            normalized = np.zeros(num_bars)
         
-        for i, amplitude in enumerate(recent_data):
-            if max_amplitude > 0:
-                normalized_amp = amplitude / max_amplitude
-            else:
-                normalized_amp = 0
-            
-            bar_height = int(normalized_amp * waveform_height * 0.8)  # 80% max height
-            
+        bar_heights = (normalized * waveform_height * 0.8).astype(np.int32)  # 80% max height
+        is_accent = normalized > 0.7  # Color based on amplitude
+        
+        # One pixel row per color; copying whole rows is far cheaper than
+        # broadcasting an RGB tuple pixel by pixel
+        waveform_fill = np.tile(
+            np.array(ImageColor.getrgb(config.waveform_color), dtype=np.uint8), (bar_width + 1, 1)
+        )
+        accent_fill = np.tile(
+            np.array(ImageColor.getrgb(config.accent_color), dtype=np.uint8), (bar_width + 1, 1)
+        )
+        
+        for i, bar_height in enumerate(bar_heights.tolist()):
             x = 50 + i * (bar_width + bar_spacing)
+            if x >= config.width:
+                break
+            x_end = min(x + bar_width + 1, config.width)
             y_top = waveform_center - bar_height // 2
             y_bottom = waveform_center + bar_height // 2
             
-            # Color based on amplitude
-            if normalized_amp > 0.7:
-                color = config.accent_color
-            else:
-                color = config.waveform_color
-            
-            draw.rectangle([x, y_top, x + bar_width, y_bottom], fill=color)
+            # Slice bounds are inclusive like ImageDraw.rectangle
+            fill = accent_fill if is_accent[i] else waveform_fill
+            canvas[y_top:y_bottom + 1, x:x_end] = fill[:x_end - x]
     
-    async def _draw_line_waveform(self, draw: ImageDraw.Draw, waveform_data: np.ndarray,
+    def _draw_line_waveform(self, canvas: np.ndarray, waveform_data: np.ndarray,
                                 config: AudiogramConfig, max_amplitude: float,
                                 waveform_top: int, waveform_height: int, waveform_center: int):
         """Draw line-style waveform"""
@@ -469,25 +672,23 @@ class AudioProcessor:
         if len(waveform_data) < 2:
             return
         
-        points = []
         width_per_point = config.width / len(waveform_data)
+        center = waveform_center - waveform_top  # Relative to the drawn rows
         
-        for i, amplitude in enumerate(waveform_data):
-            if max_amplitude > 0:
-                normalized_amp = amplitude / max_amplitude
-            else:
-                normalized_amp = 0
-            
-            x = int(i * width_per_point)
-            y = waveform_center - int(normalized_amp * waveform_height * 0.4)
-            points.append((x, y))
+        if max_amplitude > 0:
+            normalized = waveform_data / max_amplitude
+        else:
+            normalized = np.zeros(len(waveform_data))
         
-        # Draw connected line
-        if len(points) > 1:
-            for i in range(len(points) - 1):
-                draw.line([points[i], points[i + 1]], fill=config.waveform_color, width=3)
+        xs = (np.arange(len(waveform_data)) * width_per_point).astype(np.int32)
+        ys = center - (normalized * waveform_height * 0.4).astype(np.int32)
+        points = np.column_stack((xs, ys)).ravel().tolist()
+        
+        # Draw connected line in a single call
+        with self._draw_rows(canvas, waveform_top, waveform_top + waveform_height) as draw:
+            draw.line(points, fill=config.waveform_color, width=3)
     
-    async def _draw_circle_waveform(self, draw: ImageDraw.Draw, waveform_data: np.ndarray,
+    def _draw_circle_waveform(self, canvas: np.ndarray, waveform_data: np.ndarray,
                                   config: AudiogramConfig, max_amplitude: float):
         """Draw circular waveform visualization"""
         
@@ -508,42 +709,53 @@ class AudioProcessor:
         # Draw pulsing circle
         radius = base_radius + int(normalized_amp * base_radius * 0.5)
         
-        # Outer circle (pulse)
-        draw.ellipse([
-            center_x - radius, center_y - radius,
-            center_x + radius, center_y + radius
-        ], outline=config.waveform_color, width=4)
+        # Only the rows the pulse covers are drawn, centered within them
+        top = center_y - radius
+        center_y -= top
         
-        # Inner circle (base)
-        inner_radius = base_radius // 2
-        draw.ellipse([
-            center_x - inner_radius, center_y - inner_radius,
-            center_x + inner_radius, center_y + inner_radius
-        ], fill=config.waveform_color)
+        with self._draw_rows(canvas, top, top + 2 * radius + 1) as draw:
+            # Outer circle (pulse)
+            draw.ellipse([
+                center_x - radius, center_y - radius,
+                center_x + radius, center_y + radius
+            ], outline=config.waveform_color, width=4)
+            
+            # Inner circle (base)
+            inner_radius = base_radius // 2
+            draw.ellipse([
+                center_x - inner_radius, center_y - inner_radius,
+                center_x + inner_radius, center_y + inner_radius
+            ], fill=config.waveform_color)
     
-    async def _draw_progress_bar(self, draw: ImageDraw.Draw, progress: float, 
-                               config: AudiogramConfig):
-        """Draw progress bar"""
+    def _draw_progress_track(self, draw: ImageDraw.Draw, config: AudiogramConfig):
+        """Draw progress bar background"""
         
         bar_height = 6
         bar_y = config.height - 80
         bar_margin = 50
         bar_width = config.width - 2 * bar_margin
         
-        # Background bar
         draw.rectangle([
             bar_margin, bar_y,
             bar_margin + bar_width, bar_y + bar_height
         ], fill="#333333")
+    
+    def _draw_progress_bar(self, canvas: np.ndarray, progress: float, 
+                               config: AudiogramConfig):
+        """Draw progress bar fill over the pre-rendered track"""
+        
+        bar_height = 6
+        bar_y = config.height - 80
+        bar_margin = 50
+        bar_width = config.width - 2 * bar_margin
         
-        # Progress bar
         progress_width = int(bar_width * progress)
-        draw.rectangle([
-            bar_margin, bar_y,
-            bar_margin + progress_width, bar_y + bar_height
-        ], fill=config.accent_color)
+        canvas[
+            bar_y:bar_y + bar_height + 1,
+            bar_margin:bar_margin + progress_width + 1
+        ] = ImageColor.getrgb(config.accent_color)
     
-    async def _draw_timestamp(self, draw: ImageDraw.Draw, current_time: float,
+    def _draw_timestamp(self, canvas: np.ndarray, current_time: float,
                             total_duration: float, config: AudiogramConfig):
         """Draw timestamp"""
         
@@ -554,38 +766,60 @@ class AudioProcessor:
         
         timestamp_text = f"{format_time(current_time)} / {format_time(total_duration)}"
         
-        try:
-            font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            font = ImageFont.load_default()
+        y = config.height - 40
+        
+        # The text only changes once a second, so reuse the last rendered rows
+        key = (timestamp_text, config.width, config.height,
+               config.background_color, config.text_color)
+        cached = self._timestamp_rows
+        if cached is not None and cached[0] == key:
+            canvas[y:] = cached[1]
+            return
         
-        bbox = draw.textbbox((0, 0), timestamp_text, font=font)
-        text_width = bbox[2] - bbox[0]
+        font = self._get_font(24)
         
-        x = (config.width - text_width) // 2
-        y = config.height - 40
+        x = (config.width - int(font.getlength(timestamp_text))) // 2
         
-        draw.text((x, y), timestamp_text, font=font, fill=config.text_color)
+        with self._draw_rows(canvas, y, config.height) as draw:
+            draw.text((x, 0), timestamp_text, font=font, fill=config.text_color)
+        
+        self._timestamp_rows = (key, canvas[y:].copy())
+    
+    def _get_font(self, size: int) -> ImageFont.ImageFont:
+        """Load a font once per size and reuse it across frames"""
+        
+        font = self._font_cache.get(size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("arial.ttf", size)
+            except OSError:
+                font = ImageFont.load_default()
+            self._font_cache[size] = font
+        
+        return font
     
     def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont,
-                   max_width: int, draw: ImageDraw.Draw) -> List[str]:
+                   max_width: int) -> List[str]:
         """Wrap text to fit within specified width"""
         
-        words = text.split()
+        # Measure each word once and accumulate instead of re-measuring the line
+        space_width = font.getlength(" ")
         lines = []
         current_line = []
+        line_width = 0.0
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            line_width = bbox[2] - bbox[0]
+        for word in text.split():
+            word_width = font.getlength(word)
+            test_width = line_width + space_width + word_width if current_line else word_width
             
-            if line_width <= max_width:
+            if test_width <= max_width:
                 current_line.append(word)
+                line_width = test_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                     current_line = [word]
+                    line_width = word_width
                 else:
                     lines.append(word)
         
@@ -594,18 +828,45 @@ class AudioProcessor:
         
         return lines
     
-    async def _create_video_from_frames(self, frames_dir: str, audio_path: str,
-                                      output_path: str, fps: int):
-        """Create video from frames and audio"""
+    def _get_encode_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent encodes to the CPU budget"""
+        if self._encode_semaphore is None:
+            # With encoder_threads=0 each x264 process already threads across every core
+            cpus = os.cpu_count() or 1
+            limit = max(1, cpus // self.encoder_threads) if self.encoder_threads else 1
+            self._encode_semaphore = asyncio.Semaphore(limit)
+        return self._encode_semaphore
+    
+    async def _open_video_encoder(self, audio_path: str, output_path: str,
+                                  config: AudiogramConfig) -> asyncio.subprocess.Process:
+        """Start ffmpeg reading raw RGB frames on stdin and muxing them with audio"""
         
         cmd = [
             "ffmpeg", "-y",
-            "-framerate", str(fps),
-            "-i", f"{frames_dir}/frame_%06d.png",
+            "-v", "error",  # Keep stderr small, nothing drains it until the end
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-s", f"{config.width}x{config.height}",
+            "-framerate", str(config.fps),
+            "-i", "-",
             "-i", audio_path,
             "-c:v", "libx264",
             "-preset", "fast",
             "-crf", "23",
+        ]
+        
+        # Audiograms are flat colors with small moving regions: they compress
+        # best with the animation tune and long keyframe intervals
+        if config.encoder_tune:
+            cmd += ["-tune", config.encoder_tune]
+        
+        cmd += ["-g", str(config.fps * config.keyframe_interval)]
+        
+        if self.encoder_threads:
+            cmd += ["-threads", str(self.encoder_threads)]
+        
+        cmd += [
+            "-pix_fmt", "yuv420p",
             "-c:a", "aac",
             "-b:a", "128k",
             "-shortest",  # Match shortest stream
@@ -613,18 +874,34 @@ class AudioProcessor:
             output_path
         ]
         
-        await self._run_command(cmd, timeout=300)
+        logger.debug(f"Running command: {' '.join(cmd)}")
+        
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
     
-    async def _cleanup_frames(self, frames_dir: Path):
-        """Clean up temporary frame files"""
+    async def _close_video_encoder(self, encoder: asyncio.subprocess.Process,
+                                   timeout: int = 300):
+        """Signal end of frames and wait for the encoder to finish"""
+        
+        encoder.stdin.close()
+        
         try:
-            for frame_file in frames_dir.glob("*.png"):
-                frame_file.unlink()
-            frames_dir.rmdir()
-        except Exception as e:
-            logger.warning(f"Could not cleanup frames: {e}")
+            _, stderr = await asyncio.wait_for(encoder.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            encoder.kill()
+            await encoder.wait()
+            raise RuntimeError(f"Command timed out after {timeout} seconds")
+        
+        if encoder.returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise RuntimeError(f"Command failed: {error_msg}")
     
-    async def _run_command(self, cmd: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+    async def _run_command(self, cmd: List[str], timeout: int = 60,
+                           decode_stdout: bool = True) -> subprocess.CompletedProcess:
         """Run command asynchronously with timeout"""
         
         logger.debug(f"Running command: {' '.join(cmd)}")
@@ -647,7 +924,7 @@ class AudioProcessor:
             
             return type('Result', (), {
                 'returncode': process.returncode,
-                'stdout': stdout.decode(),
+                'stdout': stdout.decode() if decode_stdout else stdout,
                 'stderr': stderr.decode()
             })()
             
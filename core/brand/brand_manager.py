@@ -6,14 +6,99 @@ Handles brand consistency, logo integration, and visual identity
 
 import os
 import json
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageFilter, ImageOps
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of entries kept in each in-memory image cache
+IMAGE_CACHE_SIZE = 32
+
+# Fixed color themes for known platforms, shared read-only across calls
+_PLATFORM_THEMES = MappingProxyType({
+    "youtube": MappingProxyType({"primary": "#FF0000", "background": "#000000", "text": "#FFFFFF"}),
+    "instagram": MappingProxyType({"primary": "#E4405F", "background": "#FFFFFF", "text": "#262626"}),
+    "tiktok": MappingProxyType({"primary": "#000000", "secondary": "#FF0050", "background": "#FFFFFF", "text": "#161823"}),
+    "twitter": MappingProxyType({"primary": "#1DA1F2", "background": "#FFFFFF", "text": "#14171A"}),
+    "linkedin": MappingProxyType({"primary": "#0077B5", "background": "#FFFFFF", "text": "#000000"})
+})
+
+# Font files tried in order for logo and text-card text
+_LOGO_FONT_CANDIDATES = ("/System/Library/Fonts/Arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
+_CARD_FONT_CANDIDATES = ("/System/Library/Fonts/Arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+
+@functools.lru_cache(maxsize=8)
+def _find_font_path(candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the first candidate font file present on this system"""
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the parsed face for repeated sizes"""
+    return ImageFont.truetype(path, size)
+
+def _get_font(candidates: Tuple[str, ...], size: int):
+    """Get the first usable candidate font at the given size, or Pillow's default"""
+    path = _find_font_path(candidates)
+    if path:
+        try:
+            return _load_font(path, size)
+        except OSError as e:
+            logger.warning(f"Could not load font {path}: {e}")
+    return ImageFont.load_default()
+
+def _stretch_column(column: np.ndarray, width: int) -> Image.Image:
+    """Widen a (height, 1, channels) uint8 column into a full image, filling rows in Pillow's C code"""
+    return Image.fromarray(column).resize((width, column.shape[0]), Image.Resampling.NEAREST)
+
+def _draw_text_with_shadow(image: Image.Image, draw: ImageDraw.ImageDraw, xy: Tuple[int, int], text: str,
+                           font, fill: Tuple[int, ...], shadow_fill: Tuple[int, ...], offset: int):
+    """Draw text over an offset drop shadow, rasterizing the glyphs once and pasting the mask twice"""
+    left, top, right, bottom = draw.textbbox(xy, text, font=font)
+    if right <= left or bottom <= top:
+        return
+    
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((xy[0] - left, xy[1] - top), text, font=font, fill=255)
+    image.paste(shadow_fill, (left + offset, top + offset), mask)
+    image.paste(fill, (left, top), mask)
+
+def _vertical_gradient(width: int, height: int, start: Tuple[int, ...], end: Tuple[int, ...]) -> Image.Image:
+    """Build a gradient image running from start to end down the rows"""
+    t = (np.arange(height, dtype=np.float32) / height)[:, None]
+    start_color = np.asarray(start, dtype=np.float32)
+    end_color = np.asarray(end, dtype=np.float32)
+    rows = (start_color + (end_color - start_color) * t).astype(np.uint8)
+    return _stretch_column(rows[:, None, :], width)
+
+def _blend_vertical_fade(width: int, height: int, base: Tuple[int, ...], overlay: Tuple[int, ...],
+                         max_alpha: int) -> Image.Image:
+    """Blend an overlay color fading in from alpha 0 to max_alpha down the rows onto a solid RGB base"""
+    alpha = (np.arange(height) * max_alpha // height).astype(np.float32)[:, None] / 255
+    base_color = np.asarray(base[:3], dtype=np.float32)
+    overlay_color = np.asarray(overlay[:3], dtype=np.float32)
+    rows = (base_color * (1 - alpha) + overlay_color * alpha + 0.5).astype(np.uint8)
+    return _stretch_column(rows[:, None, :], width)
+
+def _hex_to_rgb(value: str) -> Tuple[int, int, int]:
+    """Parse a '#RRGGBB' color string into an (r, g, b) tuple"""
+    return tuple(int(value[i:i+2], 16) for i in (1, 3, 5))
+
 @dataclass
 class BrandColors:
     """Brand color palette"""
@@ -27,6 +112,16 @@ class BrandColors:
     success: str
     warning: str
     error: str
+    _rgb: Dict[str, Tuple[int, int, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._rgb = {name: _hex_to_rgb(value) for name, value in vars(self).items()
+                     if isinstance(value, str) and value.startswith('#')}
+    
+    def rgb(self, name: str) -> Tuple[int, int, int]:
+        """Get a palette color as an (r, g, b) tuple, parsed once at construction"""
+        rgb = self._rgb.get(name)
+        return rgb if rgb is not None else ImageColor.getrgb(getattr(self, name))[:3]
 
 @dataclass
 class BrandConfig:
@@ -37,6 +132,7 @@ class BrandConfig:
     logo_path: Optional[str] = None
     dark_logo_path: Optional[str] = None
     icon_path: Optional[str] = None
+    watermark_resample: str = "bicubic"
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BrandConfig':
@@ -44,15 +140,41 @@ class BrandConfig:
         colors = BrandColors(**data.get('colors', {}))
         
         logo_config = data.get('logo', {})
+        watermark_config = data.get('watermark', {})
         return cls(
             name=data.get('brand_name', 'ClipFlow'),
             tagline=data.get('tagline', 'Universal Content Automation Platform'),
             colors=colors,
             logo_path=logo_config.get('path'),
             dark_logo_path=logo_config.get('dark_mode_path'),
-            icon_path=logo_config.get('icon_path')
+            icon_path=logo_config.get('icon_path'),
+            watermark_resample=watermark_config.get('resample', 'bicubic')
         )
 
+# Shared fallback configuration used when no brand config file can be read
+_DEFAULT_CONFIG = BrandConfig(
+    name="ClipFlow",
+    tagline="Universal Content Automation Platform",
+    colors=BrandColors(
+        primary="#6366F1",
+        secondary="#8B5CF6",
+        accent="#F59E0B",
+        background="#F8FAFC",
+        dark_background="#0F172A",
+        text="#1E293B",
+        text_secondary="#64748B",
+        success="#10B981",
+        warning="#F59E0B",
+        error="#EF4444"
+    )
+)
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime: float) -> BrandConfig:
+    """Parse a brand config file, reusing the result until its modification time changes"""
+    data = Path(path).read_bytes()
+    return BrandConfig.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+
 class BrandManager:
     """Manages brand assets and visual identity"""
     
@@ -61,23 +183,41 @@ class BrandManager:
         self.assets_dir = Path("assets")
         self.templates_dir = Path("templates")
         
-        # Create directories
+        # LRU caches for loaded logos and opacity-adjusted watermark logos
+        self._image_cache: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._watermark_cache: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+    
+    @staticmethod
+    def _cache_lookup(cache: OrderedDict, key) -> Optional[Image.Image]:
+        """Get a cached image and mark it as recently used"""
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key)
+        return image
+    
+    @staticmethod
+    def _cache_store(cache: OrderedDict, key, image: Image.Image):
+        """Store an image, evicting the least recently used entry when full"""
+        cache[key] = image
+        cache.move_to_end(key)
+        if len(cache) > IMAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    @functools.cached_property
+    def brand_config(self) -> BrandConfig:
+        """Brand configuration, loaded on first access"""
+        return self._load_brand_config()
+    
+    def _ensure_dirs(self):
+        """Create the asset and template directories"""
         self.assets_dir.mkdir(exist_ok=True)
         self.templates_dir.mkdir(exist_ok=True)
-        
-        # Load brand configuration
-        self.brand_config = self._load_brand_config()
-        
-        # Cache for loaded images
-        self._image_cache = {}
     
     def _load_brand_config(self) -> BrandConfig:
         """Load brand configuration from JSON file"""
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                return BrandConfig.from_dict(data)
+                return _load_config_cached(str(self.config_path), self.config_path.stat().st_mtime)
             else:
                 logger.warning(f"Brand config not found at {self.config_path}, using defaults")
                 return self._create_default_config()
@@ -86,45 +226,40 @@ class BrandManager:
             return self._create_default_config()
     
     def _create_default_config(self) -> BrandConfig:
-        """Create default brand configuration"""
-        colors = BrandColors(
-            primary="#6366F1",
-            secondary="#8B5CF6",
-            accent="#F59E0B",
-            background="#F8FAFC",
-            dark_background="#0F172A",
-            text="#1E293B",
-            text_secondary="#64748B",
-            success="#10B981",
-            warning="#F59E0B",
-            error="#EF4444"
-        )
-        
-        return BrandConfig(
-            name="ClipFlow",
-            tagline="Universal Content Automation Platform",
-            colors=colors
-        )
+        """Get the default brand configuration (shared, do not mutate)"""
+        return _DEFAULT_CONFIG
     
-    def get_logo(self, dark_mode: bool = False, size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
-        """Get brand logo image"""
+    def get_logo(self, dark_mode: bool = False, size: Optional[Tuple[int, int]] = None,
+                 immutable: bool = True,
+                 resample: Image.Resampling = Image.Resampling.LANCZOS) -> Optional[Image.Image]:
+        """Get brand logo image (shared with the cache unless immutable=False, so do not mutate it)"""
         logo_path = self.brand_config.dark_logo_path if dark_mode else self.brand_config.logo_path
         
         if not logo_path or not Path(logo_path).exists():
             # Create default logo if none exists
             return self._create_default_logo(size or (200, 60))
         
-        cache_key = f"{logo_path}_{size}"
-        if cache_key in self._image_cache:
-            return self._image_cache[cache_key].copy()
+        cache_key = f"{logo_path}_{size}_{resample}"
+        cached = self._cache_lookup(self._image_cache, cache_key)
+        if cached is not None:
+            return cached if immutable else cached.copy()
         
         try:
             logo = Image.open(logo_path)
             if size:
-                logo = logo.resize(size, Image.Resampling.LANCZOS)
+                if logo.width <= size[0] and logo.height <= size[1]:
+                    # Smaller than the box: scale up to fit it (thumbnail never enlarges)
+                    logo = ImageOps.contain(logo, size, method=resample)
+                else:
+                    # Fit within size in place, keeping the aspect ratio; thumbnail drafts JPEGs
+                    # at a reduced scale and box-reduces large downscales before the resampling pass
+                    logo.thumbnail(size, resample, reducing_gap=2.0)
+            else:
+                # Decode now so the cached image does not hold the file open
+                logo.load()
             
-            self._image_cache[cache_key] = logo.copy()
-            return logo
+            self._cache_store(self._image_cache, cache_key, logo)
+            return logo if immutable else logo.copy()
         except Exception as e:
             logger.error(f"Error loading logo: {e}")
             return self._create_default_logo(size or (200, 60))
@@ -133,103 +268,94 @@ class BrandManager:
         """Create default ClipFlow logo"""
         width, height = size
         
-        # Create image with gradient background
-        logo = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        # Create image with gradient background (#6366F1 to #8B5CF6)
+        logo = _vertical_gradient(width, height, (99, 102, 241, 200), (139, 92, 246, 200))
         draw = ImageDraw.Draw(logo)
         
-        # Draw gradient background
-        for i in range(height):
-            r = int(99 + (139 - 99) * i / height)  # #6366F1 to #8B5CF6
-            g = int(102 + (92 - 102) * i / height)
-            b = int(241 + (246 - 241) * i / height)
-            draw.line([(0, i), (width, i)], fill=(r, g, b, 200))
-        
         # Draw rounded rectangle
         corner_radius = min(width, height) // 8
-        self._draw_rounded_rectangle(draw, 0, 0, width, height, corner_radius, 
-                                   fill=(99, 102, 241, 230))
+        draw.rounded_rectangle((0, 0, width, height), radius=corner_radius, fill=(99, 102, 241, 230))
         
         # Add ClipFlow text
         try:
             # Try to use a good font
             font_size = max(12, height // 4)
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
+            font = _get_font(_LOGO_FONT_CANDIDATES, font_size)
             
             text = self.brand_config.name
             
             # Get text dimensions
+            text_width = draw.textlength(text, font=font)
             bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             
             # Center text
-            x = (width - text_width) // 2
+            x = int(width - text_width) // 2
             y = (height - text_height) // 2
             
             # Draw text with shadow
-            draw.text((x + 1, y + 1), text, font=font, fill=(0, 0, 0, 128))
-            draw.text((x, y), text, font=font, fill=(255, 255, 255, 255))
+            _draw_text_with_shadow(logo, draw, (x, y), text, font, (255, 255, 255, 255), (0, 0, 0, 128), 1)
             
         except Exception as e:
             logger.warning(f"Could not add text to logo: {e}")
         
         return logo
     
-    def _draw_rounded_rectangle(self, draw: ImageDraw.Draw, x1: int, y1: int, 
-                              x2: int, y2: int, radius: int, **kwargs):
-        """Draw rounded rectangle"""
-        draw.rectangle([x1 + radius, y1, x2 - radius, y2], **kwargs)
-        draw.rectangle([x1, y1 + radius, x2, y2 - radius], **kwargs)
-        
-        # Corners
-        draw.pieslice([x1, y1, x1 + 2*radius, y1 + 2*radius], 180, 270, **kwargs)
-        draw.pieslice([x2 - 2*radius, y1, x2, y1 + 2*radius], 270, 360, **kwargs)
-        draw.pieslice([x1, y2 - 2*radius, x1 + 2*radius, y2], 90, 180, **kwargs)
-        draw.pieslice([x2 - 2*radius, y2 - 2*radius, x2, y2], 0, 90, **kwargs)
-    
     def apply_watermark(self, image: Image.Image, position: str = "bottom_right", 
                        opacity: float = 0.7, margin: int = 20) -> Image.Image:
         """Apply brand watermark to image"""
         try:
             # Get logo
             logo_size = (min(image.width, image.height) // 6, min(image.width, image.height) // 10)
-            logo = self.get_logo(size=logo_size)
+            logo = self._get_watermark_logo(logo_size, opacity)
             
             if not logo:
                 return image
             
-            # Apply opacity
-            if opacity < 1.0:
-                logo = logo.convert("RGBA")
-                alpha = logo.split()[-1]
-                alpha = alpha.point(lambda p: int(p * opacity))
-                logo.putalpha(alpha)
-            
             # Calculate position
             x, y = self._calculate_watermark_position(
                 image.size, logo.size, position, margin
             )
             
-            # Apply watermark
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-            
-            watermarked = Image.new('RGBA', image.size, (0, 0, 0, 0))
-            watermarked.paste(image, (0, 0))
+            # Apply watermark onto a single RGB copy, using the logo's alpha as the paste mask
+            watermarked = image.convert('RGB') if image.mode != 'RGB' else image.copy()
             watermarked.paste(logo, (x, y), logo)
             
-            return watermarked.convert('RGB')
+            return watermarked
             
         except Exception as e:
             logger.error(f"Error applying watermark: {e}")
             return image
     
+    def _get_watermark_resample(self) -> Image.Resampling:
+        """Resampling filter for watermark logos (cheaper than LANCZOS at thumbnail scale)"""
+        name = self.brand_config.watermark_resample
+        try:
+            return Image.Resampling[name.upper()]
+        except KeyError:
+            logger.warning(f"Unknown watermark resample filter '{name}', using bicubic")
+            return Image.Resampling.BICUBIC
+    
+    def _get_watermark_logo(self, logo_size: Tuple[int, int], opacity: float) -> Optional[Image.Image]:
+        """Get the resized, opacity-adjusted watermark logo, shared across calls (do not mutate)"""
+        cache_key = (self.brand_config.logo_path, logo_size, opacity)
+        cached = self._cache_lookup(self._watermark_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        logo = self.get_logo(size=logo_size, resample=self._get_watermark_resample())
+        if not logo:
+            return None
+        
+        # Apply opacity
+        if opacity < 1.0:
+            logo = logo.convert("RGBA")
+            alpha = np.asarray(logo.getchannel('A'))
+            logo.putalpha(Image.fromarray((alpha * opacity).astype(np.uint8)))
+        
+        self._cache_store(self._watermark_cache, cache_key, logo)
+        return logo
+    
     def _calculate_watermark_position(self, image_size: Tuple[int, int], 
                                     logo_size: Tuple[int, int], 
                                     position: str, margin: int) -> Tuple[int, int]:
@@ -252,79 +378,60 @@ class BrandManager:
         """Create branded text card for social media"""
         
         # Use brand colors
-        bg_color = background_color or self.brand_config.colors.background
-        if bg_color.startswith('#'):
-            bg_color = tuple(int(bg_color[i:i+2], 16) for i in (1, 3, 5))
-        
-        # Create image
-        image = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-        
-        # Add gradient overlay
-        overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        colors = self.brand_config.colors
+        if not background_color:
+            bg_color = colors.rgb('background')
+        elif background_color.startswith('#'):
+            bg_color = _hex_to_rgb(background_color)
+        else:
+            bg_color = ImageColor.getrgb(background_color)
         
-        # Gradient from primary to secondary color
-        primary = self.brand_config.colors.primary
-        secondary = self.brand_config.colors.secondary
-        
-        # Simple vertical gradient
-        for i in range(height):
-            alpha = int(50 * i / height)  # Fade from 0 to 50
-            overlay_draw.line([(0, i), (width, i)], fill=(99, 102, 241, alpha))
-        
-        image = Image.alpha_composite(image.convert('RGBA'), overlay).convert('RGB')
+        # Create image with a simple vertical gradient overlay, alpha fading from 0 to 50,
+        # blended straight into the RGB background
+        image = _blend_vertical_fade(width, height, bg_color, (99, 102, 241), 50)
         draw = ImageDraw.Draw(image)
         
         # Add text
         try:
             font_size = min(width, height) // 15
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
+            font = _get_font(_CARD_FONT_CANDIDATES, font_size)
             
-            # Word wrap text
-            words = text.split()
-            lines = []
-            current_line = ""
+            # Word wrap text, measuring each word once and accumulating line widths
+            max_line_width = width - 100  # 50px margin on each side
+            space_width = draw.textlength(" ", font=font)
+            lines = []  # (line, width) pairs, reusing the widths measured while wrapping
+            current_line = []
+            line_width = 0.0
             
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                if bbox[2] - bbox[0] <= width - 100:  # 50px margin on each side
-                    current_line = test_line
+            for word in text.split():
+                word_width = draw.textlength(word, font=font)
+                test_width = line_width + space_width + word_width if current_line else word_width
+                if test_width <= max_line_width:
+                    current_line.append(word)
+                    line_width = test_width
                 else:
                     if current_line:
-                        lines.append(current_line)
-                        current_line = word
+                        lines.append((' '.join(current_line), line_width))
+                        current_line = [word]
+                        line_width = word_width
                     else:
-                        lines.append(word)
+                        lines.append((word, word_width))
             
             if current_line:
-                lines.append(current_line)
+                lines.append((' '.join(current_line), line_width))
             
             # Draw text lines
             total_height = len(lines) * (font_size + 10)
             start_y = (height - total_height) // 2
             
-            text_color = self.brand_config.colors.text
-            if text_color.startswith('#'):
-                text_color = tuple(int(text_color[i:i+2], 16) for i in (1, 3, 5))
+            text_color = colors.rgb('text')
             
-            for i, line in enumerate(lines):
-                bbox = draw.textbbox((0, 0), line, font=font)
-                line_width = bbox[2] - bbox[0]
-                x = (width - line_width) // 2
+            for i, (line, line_width) in enumerate(lines):
+                x = int(width - line_width) // 2
                 y = start_y + i * (font_size + 10)
                 
-                # Text shadow
-                draw.text((x + 2, y + 2), line, font=font, fill=(0, 0, 0, 128))
-                # Main text
-                draw.text((x, y), line, font=font, fill=text_color)
+                # Main text over its shadow
+                _draw_text_with_shadow(image, draw, (x, y), line, font, text_color, (0, 0, 0, 128), 2)
         
         except Exception as e:
             logger.error(f"Error adding text to card: {e}")
@@ -332,38 +439,40 @@ class BrandManager:
         # Add logo watermark
         return self.apply_watermark(image, position="bottom_right", opacity=0.6)
     
-    def get_platform_colors(self, platform: str) -> Dict[str, str]:
-        """Get platform-specific colors"""
-        platform_themes = {
-            "youtube": {"primary": "#FF0000", "background": "#000000", "text": "#FFFFFF"},
-            "instagram": {"primary": "#E4405F", "background": "#FFFFFF", "text": "#262626"},
-            "tiktok": {"primary": "#000000", "secondary": "#FF0050", "background": "#FFFFFF", "text": "#161823"},
-            "twitter": {"primary": "#1DA1F2", "background": "#FFFFFF", "text": "#14171A"},
-            "linkedin": {"primary": "#0077B5", "background": "#FFFFFF", "text": "#000000"}
-        }
+    def get_platform_colors(self, platform: str) -> Mapping[str, str]:
+        """Get platform-specific colors (read-only for known platforms)"""
+        theme = _PLATFORM_THEMES.get(platform.lower())
+        if theme is not None:
+            return theme
         
-        return platform_themes.get(platform.lower(), {
+        return {
             "primary": self.brand_config.colors.primary,
             "background": self.brand_config.colors.background,
             "text": self.brand_config.colors.text
-        })
+        }
     
-    def save_brand_asset(self, image: Image.Image, filename: str) -> str:
-        """Save brand asset to assets directory"""
+    def save_brand_asset(self, image: Image.Image, filename: str, final: bool = False) -> str:
+        """Save brand asset to assets directory (final=True spends extra time on smaller files)"""
         asset_path = self.assets_dir / filename
         
+        # Intermediate assets use fast zlib settings; final deliverables get the full optimizer
+        png_options = {'optimize': True} if final else {'compress_level': 1}
+        jpeg_options = {'quality': 95, 'optimize': True} if final else {'quality': 90}
+        
         try:
+            self._ensure_dirs()
+            
             # Ensure proper format
             if filename.lower().endswith('.png'):
-                image.save(asset_path, 'PNG', optimize=True)
+                image.save(asset_path, 'PNG', **png_options)
             elif filename.lower().endswith(('.jpg', '.jpeg')):
                 if image.mode in ('RGBA', 'LA', 'P'):
                     image = image.convert('RGB')
-                image.save(asset_path, 'JPEG', quality=95, optimize=True)
+                image.save(asset_path, 'JPEG', **jpeg_options)
             else:
                 # Default to PNG
                 asset_path = asset_path.with_suffix('.png')
-                image.save(asset_path, 'PNG', optimize=True)
+                image.save(asset_path, 'PNG', **png_options)
             
             logger.info(f"Saved brand asset: {asset_path}")
             return str(asset_path)
@@ -380,12 +489,12 @@ async def main():
     # Create default logo
     logo = brand_manager.get_logo(size=(300, 100))
     if logo:
-        brand_manager.save_brand_asset(logo, "clipflow_logo.png")
+        brand_manager.save_brand_asset(logo, "clipflow_logo.png", final=True)
     
     # Create dark mode logo
     dark_logo = brand_manager.get_logo(dark_mode=True, size=(300, 100))
     if dark_logo:
-        brand_manager.save_brand_asset(dark_logo, "clipflow_logo_dark.png")
+        brand_manager.save_brand_asset(dark_logo, "clipflow_logo_dark.png", final=True)
     
     # Create text card
     text_card = brand_manager.create_text_card(
@@ -393,7 +502,7 @@ async def main():
         width=1080,
         height=1080
     )
-    brand_manager.save_brand_asset(text_card, "sample_text_card.jpg")
+    brand_manager.save_brand_asset(text_card, "sample_text_card.jpg", final=True)
     
     print("✅ Brand assets created successfully!")
 
@@ -6,18 +6,102 @@ Handles resizing, cropping, effects, brand overlays for all platforms
 
 import os
 import asyncio
+import functools
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Callable, Dict, List, Tuple, Optional, TypeVar
 from dataclasses import dataclass
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-from PIL.ExifTags import ORIENTATION
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageStat, ExifTags
 import io
+import math
+import struct
 import logging
-import colorsys
-import numpy as np
+import PIL
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Instagram allows at most 10 images per carousel
+CAROUSEL_MAX_IMAGES = 10
+
+# Worker threads running blocking Pillow work for one processor; Pillow releases
+# the GIL while decoding, resizing, filtering and encoding
+IMAGE_POOL_WORKERS = min(CAROUSEL_MAX_IMAGES, os.cpu_count() or 1)
+
+# Per-channel RGB lookup table for the vintage warm tone: red x1.1, green unchanged, blue x0.9
+_VINTAGE_WARM_LUT = (
+    [min(int(v * 1.1), 255) for v in range(256)]
+    + list(range(256))
+    + [int(v * 0.9) for v in range(256)]
+)
+
+@functools.lru_cache(maxsize=None)
+def _log_pillow_build():
+    """Log the Pillow build once per process, so deployments can confirm a Pillow-SIMD install"""
+    logger.info(f"Using Pillow {PIL.__version__} (core {getattr(Image.core, 'PILLOW_VERSION', 'unknown')})")
+
+def _read_orientation(img: Image.Image) -> int:
+    """EXIF orientation of an opened image (1 when absent), parsing the EXIF block once"""
+    try:
+        exif = getattr(img, '_getexif', lambda: None)()
+        return exif.get(ExifTags.Base.Orientation, 1) if exif else 1
+    except Exception:
+        return 1  # Ignore EXIF errors
+
+@functools.lru_cache(maxsize=32)
+def _get_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to Pillow's default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=16)
+def _opacity_lut(opacity: float) -> Tuple[int, ...]:
+    """point() table scaling an alpha channel by opacity"""
+    return tuple(int(x * opacity) for x in range(256))
+
+@functools.lru_cache(maxsize=16)
+def _load_overlay_logo(logo_path: str, mtime: float, logo_width: int, opacity: float) -> Image.Image:
+    """Open, resize and fade a logo for overlays, shared across calls until the file changes (do not mutate)"""
+    with Image.open(logo_path) as logo:
+        logo_height = int(logo.height * logo_width / logo.width)
+        # Logos are small, so bicubic is indistinguishable from Lanczos here
+        logo = logo.resize((logo_width, logo_height), Image.Resampling.BICUBIC)
+    
+    # Convert to RGBA for transparency
+    if logo.mode != "RGBA":
+        logo = logo.convert("RGBA")
+    
+    # Apply opacity
+    if opacity < 1.0:
+        logo.putalpha(logo.getchannel("A").point(_opacity_lut(opacity)))
+    
+    return logo
+
+def _mean_gray(img: Image.Image) -> int:
+    """Mean grayscale level, rounded the way ImageEnhance.Contrast computes it"""
+    return int(ImageStat.Stat(img.convert("L")).mean[0] + 0.5)
+
+def _f32(x: float) -> float:
+    """Round to single precision, the type Image.blend computes in"""
+    return struct.unpack("f", struct.pack("f", x))[0]
+
+def _blend_level(base: int, v: int, alpha: float) -> int:
+    """One channel level of Image.blend(base, v, alpha), rounded exactly as Pillow does"""
+    alpha = _f32(alpha)
+    return min(max(int(_f32(base + _f32(alpha * (v - base)))), 0), 255)
+
+def _tone_lut(bands: int, contrast: float = 1.0, mean: int = 128, brightness: float = 1.0) -> List[int]:
+    """Per-band point() table for ImageEnhance contrast about mean followed by brightness"""
+    table = [_blend_level(0, _blend_level(mean, v, contrast), brightness) for v in range(256)]
+    return table * bands
+
+def _enhance_contrast(img: Image.Image, factor: float) -> Image.Image:
+    """ImageEnhance.Contrast as a single lookup pass, without the full-size gray degenerate image"""
+    return img.point(_tone_lut(len(img.getbands()), contrast=factor, mean=_mean_gray(img)))
+
 @dataclass
 class ImageSpecs:
     """Platform-specific image specifications"""
@@ -26,6 +110,8 @@ class ImageSpecs:
     quality: int = 95
     format: str = "JPEG"
     max_file_size: int = 15 * 1024 * 1024  # 15MB default
+    draft_scale: int = 2  # Decode JPEGs at no less than this multiple of the target size (0 disables)
+    resample: Image.Resampling = Image.Resampling.BICUBIC
 
 @dataclass
 class ImageInfo:
@@ -63,17 +149,25 @@ class ImageProcessor:
         
         for dir_path in [self.temp_dir, self.output_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Blocking image work runs here, off the event loop
+        self._pool = ThreadPoolExecutor(max_workers=IMAGE_POOL_WORKERS, thread_name_prefix="image")
+        
+        _log_pillow_build()
+    
+    async def _run_in_pool(self, func: Callable[..., T], *args) -> T:
+        """Run a blocking image call on the processor's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+    
+    def close(self):
+        """Stop the image worker threads"""
+        self._pool.shutdown(wait=True)
     
     def get_image_info(self, image_path: str) -> ImageInfo:
         """Extract image metadata"""
         try:
             with Image.open(image_path) as img:
-                # Handle EXIF orientation
-                orientation = 1
-                if hasattr(img, '_getexif') and img._getexif():
-                    exif = img._getexif()
-                    orientation = exif.get(ORIENTATION, 1)
-                
                 return ImageInfo(
                     width=img.width,
                     height=img.height,
@@ -81,7 +175,7 @@ class ImageProcessor:
                     mode=img.mode,
                     file_size=os.path.getsize(image_path),
                     has_transparency=img.mode in ("RGBA", "LA", "P") and "transparency" in img.info,
-                    orientation=orientation
+                    orientation=_read_orientation(img)
                 )
         except Exception as e:
             logger.error(f"Error getting image info: {e}")
@@ -102,22 +196,29 @@ class ImageProcessor:
         
         logger.info(f"Processing image for {platform}: {specs.width}x{specs.height}")
         
-        # Process image
-        processed_img = await self._process_image(input_path, specs, brand_config, style)
-        
-        # Save with optimization
-        await self._save_optimized(processed_img, str(output_path), specs)
+        await self._run_in_pool(self._render_to_file, input_path, str(output_path), specs, brand_config, style)
         
         return str(output_path)
     
-    async def _process_image(self, input_path: str, specs: ImageSpecs,
-                           brand_config: Optional[Dict] = None, 
-                           style: str = "default") -> Image.Image:
+    def _render_to_file(self, input_path: str, output_path: str, specs: ImageSpecs,
+                        brand_config: Optional[Dict], style: str):
+        """Process an image and save it with optimization (blocking)"""
+        processed_img = self._process_image(input_path, specs, brand_config, style)
+        self._save_optimized(processed_img, output_path, specs)
+    
+    def _process_image(self, input_path: str, specs: ImageSpecs,
+                       brand_config: Optional[Dict] = None, 
+                       style: str = "default") -> Image.Image:
         """Process image with all transformations"""
         
         # Open and fix orientation
         img = Image.open(input_path)
-        img = self._fix_orientation(img)
+        if img.format == "JPEG" and specs.draft_scale:
+            # Let libjpeg skip most of the IDCT work for pixels the resize would discard;
+            # square bound so the size still holds if EXIF orientation rotates the image
+            bound = max(specs.width, specs.height) * specs.draft_scale
+            img.draft(img.mode, (bound, bound))
+        img = self._fix_orientation(img, _read_orientation(img))
         
         # Convert to RGB if needed
         if img.mode in ("RGBA", "LA", "P"):
@@ -134,37 +235,31 @@ class ImageProcessor:
                 img = img.convert("RGB")
         
         # Smart crop and resize
-        img = await self._smart_crop_and_resize(img, specs.width, specs.height)
+        img = self._smart_crop_and_resize(img, specs.width, specs.height, specs.resample)
         
         # Apply style effects
         if style != "default":
-            img = await self._apply_style_effects(img, style)
+            img = self._apply_style_effects(img, style)
         
         # Add brand overlay
         if brand_config:
-            img = await self._add_brand_overlay(img, brand_config)
+            img = self._add_brand_overlay(img, brand_config)
         
         return img
     
-    def _fix_orientation(self, img: Image.Image) -> Image.Image:
-        """Fix image orientation based on EXIF data"""
-        try:
-            if hasattr(img, '_getexif') and img._getexif():
-                exif = img._getexif()
-                orientation = exif.get(ORIENTATION, 1)
-                
-                if orientation == 3:
-                    img = img.rotate(180, expand=True)
-                elif orientation == 6:
-                    img = img.rotate(270, expand=True)
-                elif orientation == 8:
-                    img = img.rotate(90, expand=True)
-        except Exception:
-            pass  # Ignore EXIF errors
+    def _fix_orientation(self, img: Image.Image, orientation: int) -> Image.Image:
+        """Fix image orientation from its already-read EXIF orientation value"""
+        if orientation == 3:
+            img = img.rotate(180, expand=True)
+        elif orientation == 6:
+            img = img.rotate(270, expand=True)
+        elif orientation == 8:
+            img = img.rotate(90, expand=True)
         
         return img
     
-    async def _smart_crop_and_resize(self, img: Image.Image, target_width: int, target_height: int) -> Image.Image:
+    def _smart_crop_and_resize(self, img: Image.Image, target_width: int, target_height: int,
+                               resample: Image.Resampling = Image.Resampling.BICUBIC) -> Image.Image:
         """Smart crop and resize maintaining important content"""
         
         current_ratio = img.width / img.height
@@ -172,7 +267,7 @@ class ImageProcessor:
         
         if abs(current_ratio - target_ratio) < 0.01:
             # Same aspect ratio, just resize
-            return img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            return img.resize((target_width, target_height), resample)
         
         # Different aspect ratios - smart crop needed
         if current_ratio > target_ratio:
@@ -189,9 +284,9 @@ class ImageProcessor:
             img = img.crop((0, top, img.width, top + new_height))
         
         # Resize to target dimensions
-        return img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        return img.resize((target_width, target_height), resample)
     
-    async def _apply_style_effects(self, img: Image.Image, style: str) -> Image.Image:
+    def _apply_style_effects(self, img: Image.Image, style: str) -> Image.Image:
         """Apply style effects to image"""
         
         effects = {
@@ -212,33 +307,21 @@ class ImageProcessor:
         enhancer = ImageEnhance.Color(img)
         img = enhancer.enhance(0.7)
         
-        # Add warm tone
-        img_array = np.array(img)
-        img_array[:, :, 0] = np.clip(img_array[:, :, 0] * 1.1, 0, 255)  # More red
-        img_array[:, :, 2] = np.clip(img_array[:, :, 2] * 0.9, 0, 255)  # Less blue
-        
-        return Image.fromarray(img_array.astype(np.uint8))
+        # Add warm tone (more red, less blue) in one table lookup pass
+        return img.point(_VINTAGE_WARM_LUT)
     
     def _apply_modern_effect(self, img: Image.Image) -> Image.Image:
         """Apply modern/clean effect"""
         # Increase contrast slightly
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(1.1)
+        img = _enhance_contrast(img, 1.1)
         
         # Slight sharpening
         return img.filter(ImageFilter.UnsharpMask(radius=1, percent=110, threshold=3))
     
     def _apply_dramatic_effect(self, img: Image.Image) -> Image.Image:
         """Apply dramatic effect"""
-        # High contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(1.3)
-        
-        # Reduce brightness slightly
-        enhancer = ImageEnhance.Brightness(img)
-        img = enhancer.enhance(0.9)
-        
-        return img
+        # High contrast, then reduce brightness slightly, fused into one lookup pass
+        return img.point(_tone_lut(len(img.getbands()), contrast=1.3, mean=_mean_gray(img), brightness=0.9))
     
     def _apply_soft_effect(self, img: Image.Image) -> Image.Image:
         """Apply soft effect"""
@@ -246,8 +329,7 @@ class ImageProcessor:
         img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
         
         # Reduce contrast
-        enhancer = ImageEnhance.Contrast(img)
-        return enhancer.enhance(0.9)
+        return _enhance_contrast(img, 0.9)
     
     def _apply_vibrant_effect(self, img: Image.Image) -> Image.Image:
         """Apply vibrant effect"""
@@ -256,8 +338,7 @@ class ImageProcessor:
         img = enhancer.enhance(1.2)
         
         # Slight contrast boost
-        enhancer = ImageEnhance.Contrast(img)
-        return enhancer.enhance(1.1)
+        return _enhance_contrast(img, 1.1)
     
     def _apply_minimal_effect(self, img: Image.Image) -> Image.Image:
         """Apply minimal effect"""
@@ -265,7 +346,7 @@ class ImageProcessor:
         enhancer = ImageEnhance.Color(img)
         return enhancer.enhance(0.8)
     
-    async def _add_brand_overlay(self, img: Image.Image, brand_config: Dict) -> Image.Image:
+    def _add_brand_overlay(self, img: Image.Image, brand_config: Dict) -> Image.Image:
         """Add brand overlay (logo, watermark, etc.)"""
         
         # Create a copy to work with
@@ -273,19 +354,19 @@ class ImageProcessor:
         
         # Add logo if specified
         if brand_config.get("logo_path") and os.path.exists(brand_config["logo_path"]):
-            img = await self._add_logo_overlay(img, brand_config)
+            img = self._add_logo_overlay(img, brand_config)
         
         # Add text watermark if specified
         if brand_config.get("watermark_text"):
-            img = await self._add_text_watermark(img, brand_config)
+            img = self._add_text_watermark(img, brand_config)
         
         # Add color accent if specified
         if brand_config.get("accent_color"):
-            img = await self._add_color_accent(img, brand_config)
+            img = self._add_color_accent(img, brand_config)
         
         return img
     
-    async def _add_logo_overlay(self, img: Image.Image, brand_config: Dict) -> Image.Image:
+    def _add_logo_overlay(self, img: Image.Image, brand_config: Dict) -> Image.Image:
         """Add logo overlay to image"""
         
         logo_path = brand_config["logo_path"]
@@ -294,44 +375,32 @@ class ImageProcessor:
         size_percent = brand_config.get("logo_size_percent", 12)
         
         try:
-            # Open and prepare logo
-            with Image.open(logo_path) as logo:
-                # Calculate logo size
-                logo_width = int(img.width * size_percent / 100)
-                logo_height = int(logo.height * logo_width / logo.width)
-                logo = logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-                
-                # Convert to RGBA for transparency
-                if logo.mode != "RGBA":
-                    logo = logo.convert("RGBA")
-                
-                # Apply opacity
-                if opacity < 1.0:
-                    alpha = logo.split()[-1]
-                    alpha = alpha.point(lambda x: int(x * opacity))
-                    logo.putalpha(alpha)
-                
-                # Calculate position
-                margin = 20
-                positions = {
-                    "top-left": (margin, margin),
-                    "top-right": (img.width - logo_width - margin, margin),
-                    "bottom-left": (margin, img.height - logo_height - margin),
-                    "bottom-right": (img.width - logo_width - margin, img.height - logo_height - margin),
-                    "center": ((img.width - logo_width) // 2, (img.height - logo_height) // 2)
-                }
-                
-                x, y = positions.get(position, positions["bottom-right"])
-                
-                # Paste logo onto image
-                img.paste(logo, (x, y), logo)
-                
+            # Get the prepared logo, resized and faded once per logo file, width and opacity
+            logo_width = int(img.width * size_percent / 100)
+            logo = _load_overlay_logo(logo_path, os.path.getmtime(logo_path), logo_width, opacity)
+            logo_height = logo.height
+            
+            # Calculate position
+            margin = 20
+            positions = {
+                "top-left": (margin, margin),
+                "top-right": (img.width - logo_width - margin, margin),
+                "bottom-left": (margin, img.height - logo_height - margin),
+                "bottom-right": (img.width - logo_width - margin, img.height - logo_height - margin),
+                "center": ((img.width - logo_width) // 2, (img.height - logo_height) // 2)
+            }
+            
+            x, y = positions.get(position, positions["bottom-right"])
+            
+            # Paste logo onto image
+            img.paste(logo, (x, y), logo)
+            
         except Exception as e:
             logger.warning(f"Could not add logo overlay: {e}")
         
         return img
     
-    async def _add_text_watermark(self, img: Image.Image, brand_config: Dict) -> Image.Image:
+    def _add_text_watermark(self, img: Image.Image, brand_config: Dict) -> Image.Image:
         """Add text watermark to image"""
         
         text = brand_config["watermark_text"]
@@ -345,10 +414,7 @@ class ImageProcessor:
             
             # Try to load font
             font_size = max(img.width // 50, 12)  # Responsive font size
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+            font = _get_font("arial.ttf", font_size)
             
             # Get text dimensions
             bbox = draw.textbbox((0, 0), text, font=font)
@@ -379,13 +445,13 @@ class ImageProcessor:
             # Apply opacity
             if opacity < 1.0:
                 color = color + (int(255 * opacity),)
-                # Create temporary image for text
-                txt_img = Image.new("RGBA", img.size, (255, 255, 255, 0))
+                # Rasterize the text onto an overlay covering only its bbox
+                txt_img = Image.new("RGBA", (text_width, text_height), (255, 255, 255, 0))
                 txt_draw = ImageDraw.Draw(txt_img)
-                txt_draw.text((x, y), text, font=font, fill=color)
+                txt_draw.text((-bbox[0], -bbox[1]), text, font=font, fill=color)
                 
-                # Composite with original
-                img = Image.alpha_composite(img.convert("RGBA"), txt_img).convert("RGB")
+                # Blend it in place through its own alpha, leaving the rest of the image untouched
+                img.paste(txt_img, (int(x + bbox[0]), int(y + bbox[1])), txt_img)
             else:
                 draw.text((x, y), text, font=font, fill=color)
                 
@@ -394,7 +460,7 @@ class ImageProcessor:
         
         return img
     
-    async def _add_color_accent(self, img: Image.Image, brand_config: Dict) -> Image.Image:
+    def _add_color_accent(self, img: Image.Image, brand_config: Dict) -> Image.Image:
         """Add subtle color accent based on brand colors"""
         
         accent_color = brand_config["accent_color"]
@@ -409,56 +475,54 @@ class ImageProcessor:
             else:
                 return img
             
-            # Create color overlay
-            overlay = Image.new("RGB", img.size, (r, g, b))
-            
-            # Blend with original
-            img = Image.blend(img, overlay, intensity)
+            # Blend toward the accent color through a per-channel lookup table,
+            # without allocating a full-size solid overlay
+            lut = [min(max(int(v + intensity * (c - v)), 0), 255) for c in (r, g, b) for v in range(256)]
+            img = img.point(lut)
             
         except Exception as e:
             logger.warning(f"Could not add color accent: {e}")
         
         return img
     
-    async def _save_optimized(self, img: Image.Image, output_path: str, specs: ImageSpecs):
+    @staticmethod
+    def _encode(img: Image.Image, image_format: str, quality: int) -> bytes:
+        """Encode an image in memory"""
+        options = {"quality": quality, "optimize": True}
+        if image_format == "JPEG":
+            # Progressive 4:2:0 JPEGs are noticeably smaller at the same quality
+            options.update(progressive=True, subsampling=2)
+        
+        buffer = io.BytesIO()
+        img.save(buffer, format=image_format, **options)
+        return buffer.getvalue()
+    
+    def _save_optimized(self, img: Image.Image, output_path: str, specs: ImageSpecs):
         """Save image with optimization for file size and quality"""
         
         quality = specs.quality
         max_size = specs.max_file_size
         
-        # Try saving with initial quality
-        while quality >= 60:  # Don't go below 60% quality
-            buffer = io.BytesIO()
-            img.save(buffer, format=specs.format, quality=quality, optimize=True)
-            
-            if buffer.tell() <= max_size:
-                # File size is acceptable
-                with open(output_path, "wb") as f:
-                    f.write(buffer.getvalue())
-                return
-            
-            # Reduce quality and try again
-            quality -= 10
+        data = self._encode(img, specs.format, quality)
         
-        # If still too large, resize image
-        scale_factor = 0.9
-        while scale_factor > 0.5:
+        if len(data) > max_size:
+            # JPEG size roughly halves for every 10 quality steps, so solve for the quality
+            # that should fit from the measured size instead of re-encoding step by step
+            target = max(60, round(quality - 10 * math.log2(len(data) / max_size)))  # Don't go below 60% quality
+            if target < quality:
+                quality = target
+                data = self._encode(img, specs.format, quality)
+        
+        if len(data) > max_size:
+            # Still too large - shrink the pixel count in proportion to the overshoot
+            scale_factor = max(0.5, math.sqrt(max_size / len(data)) * 0.95)
             new_width = int(img.width * scale_factor)
             new_height = int(img.height * scale_factor)
-            resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            buffer = io.BytesIO()
-            resized_img.save(buffer, format=specs.format, quality=75, optimize=True)
-            
-            if buffer.tell() <= max_size:
-                with open(output_path, "wb") as f:
-                    f.write(buffer.getvalue())
-                return
-            
-            scale_factor -= 0.1
+            resized_img = img.resize((new_width, new_height), specs.resample)
+            data = self._encode(resized_img, specs.format, quality)
         
-        # Final fallback - save as is
-        img.save(output_path, format=specs.format, quality=60, optimize=True)
+        with open(output_path, "wb") as f:
+            f.write(data)
     
     def _get_platform_specs(self, platform: str) -> ImageSpecs:
         """Get platform-specific image specifications"""
@@ -467,9 +531,11 @@ class ImageProcessor:
             "instagram_post": ImageSpecs(width=1080, height=1080, quality=95),  # Square
             "instagram_story": ImageSpecs(width=1080, height=1920, quality=90), # 9:16
             "twitter_post": ImageSpecs(width=1200, height=675, quality=85),     # 16:9
-            "twitter_header": ImageSpecs(width=1500, height=500, quality=90),
+            "twitter_header": ImageSpecs(width=1500, height=500, quality=90,
+                                         resample=Image.Resampling.LANCZOS),  # Hard downscale from tall sources
             "linkedin_post": ImageSpecs(width=1200, height=628, quality=90),    # 1.91:1
-            "linkedin_banner": ImageSpecs(width=1584, height=396, quality=95),
+            "linkedin_banner": ImageSpecs(width=1584, height=396, quality=95,
+                                          resample=Image.Resampling.LANCZOS),
             "facebook_post": ImageSpecs(width=1200, height=630, quality=85),
             "youtube_thumbnail": ImageSpecs(width=1280, height=720, quality=95),
             "tiktok": ImageSpecs(width=1080, height=1920, quality=90)
@@ -489,33 +555,44 @@ class CarouselGenerator:
                             style: str = "default") -> List[str]:
         """Create carousel from multiple images"""
         
-        output_paths = []
-        
-        for i, img_path in enumerate(images[:10]):  # Max 10 images for IG
-            output_path = await self.processor.process_for_platform(
+        # Images are processed side by side on the processor's thread pool
+        tasks = [
+            self.processor.process_for_platform(
                 img_path, f"{platform}_carousel_{i+1}",
                 user_id, f"{content_id}_{i+1}",
                 brand_config, style
             )
-            output_paths.append(output_path)
+            for i, img_path in enumerate(images[:CAROUSEL_MAX_IMAGES])
+        ]
         
-        return output_paths
+        return list(await asyncio.gather(*tasks))
     
     async def create_before_after(self, before_img: str, after_img: str,
                                 platform: str, user_id: int, content_id: str,
                                 brand_config: Optional[Dict] = None) -> str:
         """Create before/after comparison image"""
         
-        # Load both images
-        img1 = Image.open(before_img)
-        img2 = Image.open(after_img)
-        
         specs = self.processor._get_platform_specs(platform)
         
-        # Resize both to half width
+        output_name = f"{content_id}_before_after_{platform}.jpg"
+        output_path = self.processor.output_dir / str(user_id) / "images" / output_name
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        await self.processor._run_in_pool(
+            self._render_before_after, before_img, after_img, str(output_path), specs
+        )
+        
+        return str(output_path)
+    
+    def _render_before_after(self, before_img: str, after_img: str,
+                             output_path: str, specs: ImageSpecs):
+        """Compose the before/after image and save it with optimization (blocking)"""
+        
+        # Load both images and resize each to half width
         half_width = specs.width // 2
-        img1 = img1.resize((half_width, specs.height), Image.Resampling.LANCZOS)
-        img2 = img2.resize((half_width, specs.height), Image.Resampling.LANCZOS)
+        with Image.open(before_img) as img1, Image.open(after_img) as img2:
+            img1 = img1.resize((half_width, specs.height), specs.resample)
+            img2 = img2.resize((half_width, specs.height), specs.resample)
         
         # Create combined image
         combined = Image.new("RGB", (specs.width, specs.height))
@@ -524,22 +601,12 @@ class CarouselGenerator:
         
         # Add "BEFORE" and "AFTER" labels
         draw = ImageDraw.Draw(combined)
-        try:
-            font = ImageFont.truetype("arial.ttf", 40)
-        except:
-            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", 40)
         
         draw.text((20, 20), "BEFORE", font=font, fill="white")
         draw.text((half_width + 20, 20), "AFTER", font=font, fill="white")
         
-        # Save
-        output_name = f"{content_id}_before_after_{platform}.jpg"
-        output_path = self.processor.output_dir / str(user_id) / "images" / output_name
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        await self.processor._save_optimized(combined, str(output_path), specs)
-        
-        return str(output_path)
+        self.processor._save_optimized(combined, output_path, specs)
 
 # Example usage
 async def main():
@@ -5,14 +5,23 @@ Abstract base for all social media platform publishers
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 import logging
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a single platform connection test
+CONNECTION_TEST_TIMEOUT = 3.0
+
+# Seconds allowed for a single media upload request on the shared client
+UPLOAD_TIMEOUT = 300.0
+
 class ContentType(Enum):
     VIDEO = "video"
     IMAGE = "image"
@@ -86,6 +95,32 @@ class BasePublisher(ABC):
         self.credentials = credentials
         self.platform = credentials.platform
         self._session = None
+        self._sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+    
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the HTTP client for the running loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._sessions.get(loop)
+        if client is None or client.is_closed:
+            # Clients bound to loops that have since closed can't be reused
+            for stale in [l for l in self._sessions if l.is_closed()]:
+                del self._sessions[stale]
+            client = httpx.AsyncClient()
+            self._sessions[loop] = client
+        self._session = client
+        return client
+    
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Drop-in for ``async with httpx.AsyncClient()`` that keeps the connection pool open"""
+        yield self._get_session()
+    
+    async def close(self):
+        """Close the HTTP client owned by the running loop"""
+        client = self._sessions.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        self._session = None
     
     @abstractmethod
     async def authenticate(self) -> bool:
@@ -326,15 +361,19 @@ class PublishManager:
         """Get list of configured platforms"""
         return list(self.publishers.keys())
     
-    async def test_all_connections(self) -> Dict[str, bool]:
-        """Test connections to all configured platforms"""
+    async def test_all_connections(self, timeout: float = CONNECTION_TEST_TIMEOUT) -> Dict[str, bool]:
+        """Test connections to all configured platforms
+        
+        Probes run concurrently and each is bounded by timeout seconds, so one
+        unresponsive platform API cannot stall the whole health check.
+        """
         
         results = {}
         tasks = []
         platforms = []
         
         for platform, publisher in self.publishers.items():
-            task = publisher.test_connection()
+            task = asyncio.wait_for(publisher.test_connection(), timeout)
             tasks.append(task)
             platforms.append(platform)
         
@@ -349,6 +388,16 @@ class PublishManager:
                     results[platform] = result
         
         return results
+    
+    async def close_all(self):
+        """Close the HTTP clients held by every publisher"""
+        results = await asyncio.gather(
+            *(publisher.close() for publisher in self.publishers.values()),
+            return_exceptions=True
+        )
+        for platform, result in zip(self.publishers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to close {platform} publisher: {result}")
 
 # Utility functions
 def create_video_payload(video_path: str, caption: str = "", title: str = "",
@@ -9,7 +9,6 @@ import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
-import httpx
 import json
 from pathlib import Path
 
@@ -37,7 +36,7 @@ class InstagramPublisher(BasePublisher):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 # Test token with basic user info request
                 response = await client.get(
                     f"{self.graph_api_base}/me",
@@ -147,7 +146,7 @@ class InstagramPublisher(BasePublisher):
         """Create video media container"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 
                 # Upload video file first (this is simplified - real implementation would use resumable upload)
                 with open(video_path, "rb") as video_file:
@@ -189,7 +188,7 @@ class InstagramPublisher(BasePublisher):
         
         while True:
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._http() as client:
                     response = await client.get(
                         f"{self.graph_api_base}/{container_id}",
                         params={
@@ -223,7 +222,7 @@ class InstagramPublisher(BasePublisher):
         """Publish the media container"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.graph_api_base}/{self.user_id}/media_publish",
                     data={
@@ -273,7 +272,7 @@ class InstagramPublisher(BasePublisher):
         image_path = payload.file_paths[0]
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 
                 # Create image container
                 with open(image_path, "rb") as image_file:
@@ -341,7 +340,7 @@ class InstagramPublisher(BasePublisher):
             # Create containers for each image
             child_containers = []
             
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 for image_path in payload.file_paths[:10]:  # Instagram max 10 images
                     
                     with open(image_path, "rb") as image_file:
@@ -471,7 +470,7 @@ class InstagramPublisher(BasePublisher):
         """Get Instagram post metrics"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.get(
                     f"{self.graph_api_base}/{post_id}/insights",
                     params={
@@ -522,7 +521,7 @@ class InstagramPublisher(BasePublisher):
         """Delete Instagram post"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.delete(
                     f"{self.graph_api_base}/{post_id}",
                     params={"access_token": self.access_token}
@@ -13,7 +13,7 @@ import httpx
 import json
 from pathlib import Path
 
-from .base_publisher import BasePublisher, ContentPayload, PublishResult, ContentType, PublishStatus, PlatformCredentials
+from .base_publisher import BasePublisher, ContentPayload, PublishResult, ContentType, PublishStatus, PlatformCredentials, UPLOAD_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ class TikTokPublisher(BasePublisher):
                 return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.api_base}/oauth/token/info/",
                     json={
@@ -74,7 +74,7 @@ class TikTokPublisher(BasePublisher):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.api_base}/oauth/refresh_token/",
                     json={
@@ -192,7 +192,7 @@ class TikTokPublisher(BasePublisher):
         """Initialize video upload and get upload URL"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.api_base}/share/video/init/",
                     json={
@@ -235,14 +235,15 @@ class TikTokPublisher(BasePublisher):
         """Upload video file to TikTok"""
         
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:  # 5 minute timeout
+            async with self._http() as client:
                 
                 with open(video_path, "rb") as video_file:
                     files = {"video": ("video.mp4", video_file, "video/mp4")}
                     
                     response = await client.put(
                         upload_url,
-                        files=files
+                        files=files,
+                        timeout=UPLOAD_TIMEOUT
                     )
                 
                 if response.status_code in [200, 201]:
@@ -289,7 +290,7 @@ class TikTokPublisher(BasePublisher):
             if payload.location:
                 post_data["body"]["post_info"]["geofencing_regions"] = [payload.location]
             
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.api_base}/share/video/publish/",
                     json=post_data,
@@ -359,7 +360,7 @@ class TikTokPublisher(BasePublisher):
         """Get TikTok video metrics"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.get(
                     f"{self.api_base}/video/query/",
                     params={
@@ -405,7 +406,7 @@ class TikTokPublisher(BasePublisher):
         """Delete TikTok video"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.api_base}/video/delete/",
                     json={
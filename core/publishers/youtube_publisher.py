@@ -13,7 +13,7 @@ import httpx
 import json
 from pathlib import Path
 
-from .base_publisher import BasePublisher, ContentPayload, PublishResult, ContentType, PublishStatus, PlatformCredentials
+from .base_publisher import BasePublisher, ContentPayload, PublishResult, ContentType, PublishStatus, PlatformCredentials, UPLOAD_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ class YouTubePublisher(BasePublisher):
         
         # Test the token
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.get(
                     f"{self.api_base}/channels",
                     params={"part": "id", "mine": "true"},
@@ -65,7 +65,7 @@ class YouTubePublisher(BasePublisher):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     "https://oauth2.googleapis.com/token",
                     data={
@@ -183,7 +183,7 @@ class YouTubePublisher(BasePublisher):
         
         try:
             # Upload using resumable upload
-            async with httpx.AsyncClient(timeout=300.0) as client:
+            async with self._http() as client:
                 
                 # Step 1: Initiate resumable upload
                 init_response = await client.post(
@@ -197,7 +197,8 @@ class YouTubePublisher(BasePublisher):
                         "Content-Type": "application/json",
                         "X-Upload-Content-Type": "video/*"
                     },
-                    json=video_metadata
+                    json=video_metadata,
+                    timeout=UPLOAD_TIMEOUT
                 )
                 
                 if init_response.status_code != 200:
@@ -223,7 +224,8 @@ class YouTubePublisher(BasePublisher):
                     headers={
                         "Content-Type": "video/*",
                         "Content-Length": str(len(video_data))
-                    }
+                    },
+                    timeout=UPLOAD_TIMEOUT
                 )
                 
                 if upload_response.status_code not in [200, 201]:
@@ -265,7 +267,7 @@ class YouTubePublisher(BasePublisher):
         if is_vertical and duration <= 60:
             try:
                 # Add #Shorts to description if not already there
-                async with httpx.AsyncClient() as client:
+                async with self._http() as client:
                     # Get current video details
                     response = await client.get(
                         f"{self.api_base}/videos",
@@ -343,7 +345,7 @@ class YouTubePublisher(BasePublisher):
         """Get video metrics from YouTube Analytics"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 # Get basic video statistics
                 response = await client.get(
                     f"{self.api_base}/videos",
@@ -385,7 +387,7 @@ class YouTubePublisher(BasePublisher):
         """Delete YouTube video"""
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.delete(
                     f"{self.api_base}/videos",
                     params={"id": post_id},
@@ -216,18 +216,21 @@ class SmartScheduler:
         candidates = []
         platform_slots = self.time_slots.get(platform, {})
         
+        # Group slots by weekday once instead of rescanning every slot for each day
+        slots_by_day: Dict[int, List[Tuple[int, TimeSlot]]] = defaultdict(list)
+        for (hour, dow), slot in platform_slots.items():
+            slots_by_day[dow].append((hour, slot))
+        excluded = set(exclude_hours)
+        
         # Look at next 7 days
         for day_offset in range(7):
             target_date = start_time + timedelta(days=day_offset)
-            day_of_week = target_date.weekday()
+            dow = target_date.weekday()
             
             # Check each slot for this day
-            for (hour, dow), slot in platform_slots.items():
-                if dow != day_of_week:
-                    continue
-                
+            for hour, slot in slots_by_day.get(dow, []):
                 # Skip if in exclude hours
-                if hour in exclude_hours:
+                if hour in excluded:
                     continue
                 
                 # Create candidate datetime
@@ -7,7 +7,7 @@ Handles video, photo, text, audio → Multi-platform optimization
 import os
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 import json
@@ -71,25 +71,42 @@ class ContentProcessor:
         for dir_path in [self.data_dir, self.temp_dir, self.content_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
     
-    async def process_content(self, content: ContentItem, target_platforms: List[Platform]) -> List[ProcessingResult]:
-        """Process content for multiple platforms"""
-        results = []
+    async def process_content(self, content: ContentItem,
+                              target_platforms: List[Platform]) -> AsyncIterator[ProcessingResult]:
+        """Process content for multiple platforms concurrently, yielding each result as it completes
+        
+        Results arrive in completion order, not in target_platforms order. Close the
+        generator (await its aclose()) to cancel platforms still in flight
+        if the consumer stops early.
+        """
         
         logger.info(f"Processing {content.content_type.value} for platforms: {[p.value for p in target_platforms]}")
         
-        for platform in target_platforms:
-            try:
-                result = await self._process_for_platform(content, platform)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing {content.content_type.value} for {platform.value}: {e}")
-                results.append(ProcessingResult(
-                    success=False,
-                    platform=platform,
-                    error=str(e)
-                ))
-        
-        return results
+        tasks = [
+            asyncio.ensure_future(self._safe_process_for_platform(content, platform))
+            for platform in target_platforms
+        ]
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Don't leave work running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _safe_process_for_platform(self, content: ContentItem, platform: Platform) -> ProcessingResult:
+        """Process content for a platform, converting errors into a failed result"""
+        try:
+            return await self._process_for_platform(content, platform)
+        except Exception as e:
+            logger.error(f"Error processing {content.content_type.value} for {platform.value}: {e}")
+            return ProcessingResult(
+                success=False,
+                platform=platform,
+                error=str(e)
+            )
     
     async def _process_for_platform(self, content: ContentItem, platform: Platform) -> ProcessingResult:
         """Process content for specific platform"""
@@ -397,9 +414,15 @@ class ContentManager:
         
         return content
     
-    async def process_content(self, content: ContentItem, platforms: List[Platform]) -> List[ProcessingResult]:
-        """Process content for multiple platforms"""
-        return await self.processor.process_content(content, platforms)
+    async def process_content(self, content: ContentItem,
+                              platforms: List[Platform]) -> AsyncIterator[ProcessingResult]:
+        """Process content for multiple platforms, yielding results in completion order"""
+        results = self.processor.process_content(content, platforms)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
     
     def _generate_content_id(self, user_id: int, content_type: ContentType, data: str) -> str:
         """Generate unique content ID"""
@@ -424,8 +447,9 @@ class ContentManager:
             "created_at": content.metadata.get("created_at", "")
         }
         
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        # Write off the event loop so concurrent submissions don't stall each other
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, metadata_file.write_text, json.dumps(metadata, indent=2))
 
 # Example usage
 async def main():
@@ -441,9 +465,7 @@ async def main():
     )
     
     platforms = [Platform.YOUTUBE, Platform.TIKTOK, Platform.INSTAGRAM]
-    results = await manager.process_content(video_content, platforms)
-    
-    for result in results:
+    async for result in manager.process_content(video_content, platforms):
         if result.success:
             print(f"✅ {result.platform.value}: {result.output_path}")
         else:
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming per-platform content processing
+"""
+
+import pytest
+import asyncio
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.processor.content_pipeline import (
+    ContentProcessor, ContentItem, ContentType, Platform, ProcessingResult
+)
+
+
+class SlowProcessor(ContentProcessor):
+    """Content processor whose platforms finish after fixed delays"""
+
+    def __init__(self, data_dir: str, delays: dict):
+        super().__init__(data_dir, data_dir)
+        self.delays = delays
+        self.cancelled = []
+
+    async def _process_for_platform(self, content, platform):
+        try:
+            await asyncio.sleep(self.delays[platform])
+        except asyncio.CancelledError:
+            self.cancelled.append(platform)
+            raise
+        if platform == Platform.TIKTOK:
+            raise RuntimeError("encoder failed")
+        return ProcessingResult(success=True, platform=platform, output_path=f"{platform.value}.mp4")
+
+
+def _content() -> ContentItem:
+    return ContentItem(id="c1", user_id=1, content_type=ContentType.TEXT, text_content="hello")
+
+
+@pytest.mark.asyncio
+class TestProcessContentStreaming:
+    """Test ContentProcessor.process_content as an async generator"""
+
+    async def test_yields_in_completion_order(self):
+        """Results arrive as platforms finish, with failures reported rather than raised"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = SlowProcessor(temp_dir, {
+                Platform.YOUTUBE: 0.05, Platform.INSTAGRAM: 0.0, Platform.TIKTOK: 0.02
+            })
+
+            results = [r async for r in processor.process_content(
+                _content(), [Platform.YOUTUBE, Platform.INSTAGRAM, Platform.TIKTOK]
+            )]
+
+            assert [r.platform for r in results] == [Platform.INSTAGRAM, Platform.TIKTOK, Platform.YOUTUBE]
+            assert [r.success for r in results] == [True, False, True]
+            assert results[1].error == "encoder failed"
+
+    async def test_closing_early_cancels_pending_platforms(self):
+        """A consumer that stops after the first result leaves no platform running"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = SlowProcessor(temp_dir, {Platform.INSTAGRAM: 0.0, Platform.YOUTUBE: 10})
+
+            with pytest.raises(ValueError):
+                results = processor.process_content(_content(), [Platform.INSTAGRAM, Platform.YOUTUBE])
+                try:
+                    async for result in results:
+                        raise ValueError("consumer failed")
+                finally:
+                    await results.aclose()
+
+            assert processor.cancelled == [Platform.YOUTUBE]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for image tone adjustments, size-limited saving and carousels
+"""
+
+import pytest
+import io
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageEnhance
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.image_processor import CarouselGenerator, ImageProcessor, ImageSpecs, _enhance_contrast, _mean_gray, _tone_lut
+
+
+def _noisy_image(size: int = 400) -> Image.Image:
+    """Gradient with noise, so JPEG size responds to quality and dimensions"""
+    rng = np.random.default_rng(0)
+    base = np.asarray(Image.linear_gradient("L").resize((size, size)).convert("RGB"), dtype=int)
+    noisy = np.clip(base + rng.integers(-40, 40, base.shape), 0, 255)
+    return Image.fromarray(noisy.astype(np.uint8))
+
+
+@pytest.fixture
+def processor():
+    """Image processor writing into a temporary directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        processor = ImageProcessor(temp_dir, temp_dir)
+        yield processor
+        processor.close()
+
+
+class TestToneLut:
+    """Test the lookup-table tone adjustments against ImageEnhance"""
+
+    @pytest.mark.parametrize("factor", [0.5, 0.9, 1.1, 1.2, 1.3, 1.5, 2.0])
+    def test_contrast_matches_image_enhance(self, factor):
+        """_enhance_contrast is pixel-identical to ImageEnhance.Contrast"""
+        img = _noisy_image(128)
+
+        expected = ImageEnhance.Contrast(img).enhance(factor)
+
+        assert _enhance_contrast(img, factor).tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("mean_level", [0, 40, 128, 200, 255])
+    def test_contrast_then_brightness_matches_image_enhance(self, mean_level):
+        """A fused contrast and brightness table equals the two enhancers in sequence"""
+        ramp = Image.frombytes("L", (256, 2), bytes(range(256)) + bytes([mean_level] * 256))
+        mean = _mean_gray(ramp)
+
+        fused = ramp.point(_tone_lut(1, contrast=1.3, mean=mean, brightness=0.9))
+        expected = ImageEnhance.Brightness(ImageEnhance.Contrast(ramp).enhance(1.3)).enhance(0.9)
+
+        assert fused.tobytes() == expected.tobytes()
+
+
+class TestSaveOptimized:
+    """Test the size-limited JPEG save"""
+
+    def _save(self, processor, img, max_file_size, calls=None):
+        if calls is not None:
+            encode = processor._encode
+
+            def counting_encode(*args):
+                calls.append(args[2])
+                return encode(*args)
+
+            processor._encode = counting_encode
+
+        output_path = os.path.join(processor.temp_dir, "out.jpg")
+        processor._save_optimized(img, output_path, ImageSpecs(width=img.width, height=img.height,
+                                                               quality=95, max_file_size=max_file_size))
+        return output_path
+
+    def test_keeps_spec_quality_when_it_fits(self, processor):
+        """An image under the limit is encoded once at the spec quality"""
+        img = _noisy_image()
+        calls = []
+
+        output_path = self._save(processor, img, 15 * 1024 * 1024, calls)
+
+        assert calls == [95]
+        assert Path(output_path).read_bytes() == processor._encode(img, "JPEG", 95)
+
+    @pytest.mark.parametrize("fraction", [0.8, 0.5, 0.3])
+    def test_fits_the_limit_within_three_encodes(self, processor, fraction):
+        """An oversized image is brought under the limit without a step-by-step search"""
+        img = _noisy_image()
+        max_size = int(len(processor._encode(img, "JPEG", 95)) * fraction)
+        calls = []
+
+        output_path = self._save(processor, img, max_size, calls)
+
+        assert len(calls) <= 3
+        assert min(calls) >= 60
+        assert os.path.getsize(output_path) <= max_size
+        with Image.open(output_path) as saved:
+            assert saved.width >= img.width // 2
+
+    def test_large_overshoot_stops_at_quality_and_scale_floors(self, processor):
+        """An unreachable limit gives quality 60 at half size rather than degrading further"""
+        img = _noisy_image()
+
+        output_path = self._save(processor, img, 1000)
+
+        with Image.open(output_path) as saved, \
+             Image.open(io.BytesIO(processor._encode(img, "JPEG", 60))) as reference:
+            assert saved.size == (img.width // 2, img.height // 2)
+            assert saved.quantization == reference.quantization
+
+
+@pytest.mark.asyncio
+class TestBeforeAfter:
+    """Test the before/after comparison image"""
+
+    async def test_composes_on_the_image_pool(self, processor, monkeypatch):
+        """Decoding, resizing and saving all run on the processor's threads"""
+        before_path = os.path.join(processor.temp_dir, "before.png")
+        after_path = os.path.join(processor.temp_dir, "after.png")
+        _noisy_image(300).save(before_path)
+        _noisy_image(200).save(after_path)
+
+        open_threads = []
+        image_open = Image.open
+
+        def recording_open(*args, **kwargs):
+            open_threads.append(threading.current_thread().name)
+            return image_open(*args, **kwargs)
+
+        monkeypatch.setattr(Image, "open", recording_open)
+
+        output_path = await CarouselGenerator(processor).create_before_after(
+            before_path, after_path, "instagram_post", user_id=1, content_id="c1"
+        )
+
+        assert len(open_threads) == 2
+        assert all(name.startswith("image") for name in open_threads)
+        with image_open(output_path) as combined:
+            assert combined.size == (1080, 1080)
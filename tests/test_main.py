@@ -13,7 +13,9 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import clipflow_main
 from clipflow_main import ClipFlowConfig, ClipFlowOrchestrator, ConfigManager
+from services.processor.content_pipeline import Platform, ProcessingResult
 
 
 class TestClipFlowConfig:
@@ -84,7 +86,8 @@ class TestConfigManager:
             del os.environ['TELEGRAM_BOT_TOKEN']
             del os.environ['CLIPFLOW_TIMEZONE']
     
-    def test_save_and_load_from_file(self):
+    @pytest.mark.asyncio
+    async def test_save_and_load_from_file(self):
         """Test saving and loading configuration from file"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             config_path = f.name
@@ -96,10 +99,10 @@ class TestConfigManager:
                 timezone="UTC"
             )
             
-            ConfigManager.save_to_file(original_config, config_path)
+            await ConfigManager.save_to_file(original_config, config_path)
             
             # Load config
-            loaded_config = ConfigManager.load_from_file(config_path)
+            loaded_config = await ConfigManager.load_from_file(config_path)
             
             assert loaded_config.telegram_bot_token == "test_token"
             assert loaded_config.timezone == "UTC"
@@ -109,6 +112,46 @@ class TestConfigManager:
             if os.path.exists(config_path):
                 os.unlink(config_path)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pretty", [False, True])
+    async def test_file_round_trip_per_json_backend(self, json_backend, pretty):
+        """Test the file round-trip with orjson and with the stdlib fallback"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.json")
+            original_config = ClipFlowConfig(
+                telegram_bot_token="test_token",
+                timezone="UTC",
+                data_dir="custom_data",
+                platform_credentials={"youtube": {"client_id": "id"}}
+            )
+
+            await ConfigManager.save_to_file(original_config, config_path, pretty=pretty)
+            loaded_config = await ConfigManager.load_from_file(config_path)
+
+            assert loaded_config == original_config
+
+    def test_json_dumps_pretty_and_compact(self, json_backend):
+        """Test compact output by default and two-space indentation when pretty"""
+        data = {"timezone": "UTC", "default_platforms": ["youtube", "tiktok"]}
+
+        compact = clipflow_main._json_dumps(data)
+        pretty = clipflow_main._json_dumps(data, pretty=True)
+
+        assert compact == b'{"timezone":"UTC","default_platforms":["youtube","tiktok"]}'
+        assert pretty.splitlines()[:3] == [b'{', b'  "timezone": "UTC",', b'  "default_platforms": [']
+        assert clipflow_main._json_loads(compact) == clipflow_main._json_loads(pretty) == data
+
+    @pytest.mark.asyncio
+    async def test_load_from_file_creates_pretty_default(self, json_backend):
+        """Test a missing config file is written out indented for hand editing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.json")
+
+            config = await ConfigManager.load_from_file(config_path)
+
+            assert config == ClipFlowConfig()
+            assert Path(config_path).read_bytes().startswith(b'{\n  "')
+
 
 @pytest.mark.asyncio
 class TestClipFlowOrchestrator:
@@ -183,6 +226,48 @@ class TestClipFlowOrchestrator:
                 assert result['content_id'].startswith('12345_')
 
 
+    async def test_process_content_streams_results_to_callback(self):
+        """on_result sees each platform as it finishes; a failing callback stops the rest"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ClipFlowConfig(
+                data_dir=temp_dir,
+                temp_dir=temp_dir
+            )
+            
+            orchestrator = ClipFlowOrchestrator(config)
+            delays = {Platform.INSTAGRAM: 0.0, Platform.YOUTUBE: 0.02, Platform.TIKTOK: 10}
+            cancelled = []
+            
+            async def fake_process(content, platform):
+                try:
+                    await asyncio.sleep(delays[platform])
+                except asyncio.CancelledError:
+                    cancelled.append(platform.value)
+                    raise
+                return ProcessingResult(success=True, platform=platform, output_path=f"{platform.value}.mp4")
+            
+            orchestrator.content_manager.processor._process_for_platform = fake_process
+            
+            seen = []
+            
+            async def on_result(processed_file):
+                seen.append(processed_file["platform"])
+                if len(seen) == 2:
+                    raise RuntimeError("bot send failed")
+            
+            result = await orchestrator.process_content_from_telegram(
+                user_id=12345,
+                content_type="text",
+                text_content="Test content",
+                platforms=["youtube", "tiktok", "instagram"],
+                on_result=on_result
+            )
+            
+            assert seen == ["instagram", "youtube"]
+            assert cancelled == ["tiktok"]
+            assert result["error"] == "bot send failed"
+
+
 class TestUtilities:
     """Test utility functions"""
     
@@ -208,6 +293,17 @@ class TestUtilities:
 
 
 # Test data fixtures
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson and once with the stdlib json fallback"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        assert clipflow_main.orjson is not None
+    else:
+        monkeypatch.setattr(clipflow_main, "orjson", None)
+    return request.param
+
+
 @pytest.fixture
 def sample_config():
     """Sample configuration for tests"""
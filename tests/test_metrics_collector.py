@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Tests for metrics storage, the daily rollup and derived columns
+"""
+
+import pytest
+import json
+import sqlite3
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.analytics import metrics_collector
+from core.analytics.metrics_collector import MetricsCollector, ContentMetrics
+
+# The rollup recomputed from scratch, for comparison with the trigger-maintained table
+ROLLUP_FROM_METRICS_SQL = """
+    SELECT user_id, platform, substr(published_at, 1, 10) AS date, content_type,
+           COUNT(*) AS posts, SUM(views) AS views,
+           SUM(likes + comments + shares + saves) AS engagement,
+           ROUND(SUM(engagement_rate), 9) AS eng_rate_sum
+    FROM content_metrics
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+"""
+
+ROLLUP_SQL = """
+    SELECT user_id, platform, date, content_type, posts, views, engagement,
+           ROUND(eng_rate_sum, 9) AS eng_rate_sum
+    FROM daily_rollup
+    WHERE posts > 0
+    ORDER BY 1, 2, 3, 4
+"""
+
+requires_generated_columns = pytest.mark.skipif(
+    not metrics_collector._GENERATED_COLUMNS,
+    reason="SQLite before 3.31 has no generated columns"
+)
+
+
+def _metrics(content_id: str, platform: str = "youtube", day: str = "2024-05-01",
+             views: int = 100, likes: int = 10, **kwargs) -> ContentMetrics:
+    return ContentMetrics(
+        content_id=content_id,
+        user_id=1,
+        platform=platform,
+        content_type=kwargs.pop("content_type", "video"),
+        post_id=f"post_{content_id}",
+        post_url="",
+        published_at=f"{day}T12:00:00+00:00",
+        views=views,
+        likes=likes,
+        **kwargs
+    )
+
+
+def _rows(conn: sqlite3.Connection, sql: str) -> list:
+    return [tuple(row) for row in conn.execute(sql)]
+
+
+@pytest.mark.asyncio
+class TestDailyRollup:
+    """Test that trigger-maintained rollup rows match content_metrics"""
+
+    async def test_rollup_tracks_inserts_replaces_and_deletes(self):
+        """Every write path leaves the rollup equal to a fresh aggregate"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = MetricsCollector(temp_dir, batch_chunk=2)
+            try:
+                await collector.store_metrics(_metrics("a", views=100, likes=10))
+                await collector.batch_store_metrics([
+                    _metrics("b", views=50, likes=5, comments=5),
+                    _metrics("c", platform="tiktok", views=300, shares=30),
+                    _metrics("d", day="2024-05-02", content_type="image", views=80, saves=8),
+                ])
+
+                # Re-collected metrics replace the stored row rather than adding a post
+                await collector.store_metrics(_metrics("a", views=400, likes=40))
+
+                conn = collector._connect()
+                with conn:
+                    conn.execute("DELETE FROM content_metrics WHERE content_id = 'c'")
+
+                rollup = _rows(conn, ROLLUP_SQL)
+                assert rollup == _rows(conn, ROLLUP_FROM_METRICS_SQL)
+                assert [row[4:7] for row in rollup if row[2] == "2024-05-01"] == [(2, 450, 50)]
+            finally:
+                collector.close()
+
+    async def test_platform_summary_reads_rollup_totals(self):
+        """get_platform_summary totals agree with the stored posts"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = MetricsCollector(temp_dir)
+            try:
+                today = datetime.now(timezone.utc).date().isoformat()
+                await collector.batch_store_metrics([
+                    _metrics("a", day=today, views=200, likes=20),
+                    _metrics("b", day=today, views=100, likes=30),
+                ])
+
+                summary = await collector.get_platform_summary(1, "youtube", days=7)
+
+                assert (summary.total_posts, summary.total_views, summary.total_engagement) == (2, 300, 50)
+                assert summary.avg_engagement_rate == pytest.approx((0.1 + 0.3) / 2)
+                assert summary.best_performing_post == "post_b"
+            finally:
+                collector.close()
+
+
+@requires_generated_columns
+class TestDerivedColumns:
+    """Test engagement_rate and ctr as generated columns"""
+
+    @pytest.mark.asyncio
+    async def test_rates_are_computed_by_sqlite(self):
+        """Stored rows get engagement_rate and ctr without Python computing them"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = MetricsCollector(temp_dir)
+            try:
+                await collector.store_metrics(
+                    _metrics("a", views=200, likes=10, comments=6, shares=2, saves=2,
+                             impressions=400, clicks=20)
+                )
+
+                row = collector._connect().execute(
+                    "SELECT engagement_rate, ctr FROM content_metrics"
+                ).fetchone()
+
+                assert row["engagement_rate"] == pytest.approx(0.1)
+                assert row["ctr"] == pytest.approx(0.05)
+            finally:
+                collector.close()
+
+    def test_legacy_table_is_migrated_and_rollup_backfilled(self):
+        """A database with plain rate columns is rebuilt, keeping rows and indexes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            legacy_ddl = metrics_collector._CONTENT_METRICS_DDL.format(
+                if_not_exists="", table="content_metrics"
+            )
+            for definition in metrics_collector._DERIVED_COLUMNS.values():
+                legacy_ddl = legacy_ddl.replace(definition, "REAL DEFAULT 0.0")
+
+            conn = sqlite3.connect(Path(temp_dir) / "metrics.db")
+            conn.execute(legacy_ddl)
+            conn.execute(
+                "INSERT INTO content_metrics (content_id, user_id, platform, content_type, "
+                "post_id, published_at, views, likes, impressions, clicks, "
+                "engagement_rate, ctr, collected_at, last_updated) "
+                "VALUES ('a', 1, 'youtube', 'video', 'post_a', '2024-05-01T12:00:00+00:00', "
+                "100, 25, 50, 5, 0.9, 0.9, 'x', 'x')"
+            )
+            conn.commit()
+            conn.close()
+
+            collector = MetricsCollector(temp_dir)
+            try:
+                assert collector._initialized
+                conn = collector._connect()
+
+                hidden = {row["name"]: row["hidden"] for row in conn.execute("PRAGMA table_xinfo(content_metrics)")}
+                assert hidden["engagement_rate"] and hidden["ctr"]
+
+                row = conn.execute("SELECT post_id, engagement_rate, ctr FROM content_metrics").fetchone()
+                assert tuple(row) == ("post_a", pytest.approx(0.25), pytest.approx(0.1))
+
+                indexes = {row["name"] for row in conn.execute("PRAGMA index_list(content_metrics)")}
+                assert {"idx_cm_user_plat_pub", "idx_cm_user_pub", "idx_cm_user_plat_engagement"} <= indexes
+
+                assert _rows(conn, ROLLUP_SQL) == _rows(conn, ROLLUP_FROM_METRICS_SQL)
+            finally:
+                collector.close()
+
+            # Reopening an already migrated database leaves it alone
+            collector = MetricsCollector(temp_dir)
+            try:
+                assert collector._connect().execute("SELECT COUNT(*) FROM content_metrics").fetchone()[0] == 1
+            finally:
+                collector.close()
+
+
+@pytest.mark.asyncio
+class TestReportExport:
+    """Test JSON report export with and without orjson"""
+
+    async def test_orjson_export_parses_to_stdlib_export(self, monkeypatch):
+        """Both serializers produce the same data, keys and indentation; only number spelling may differ"""
+        pytest.importorskip("orjson")
+        report = metrics_collector.PerformanceReport(
+            user_id=1,
+            report_period="30 days",
+            generated_at="2024-05-01T12:00:00+00:00",
+            platform_summaries=[metrics_collector._empty_platform_summary("youtube")],
+            top_performers=[_metrics("a", engagement_rate=0.00001, aspect_ratio="9:16")],
+            growth_metrics={"views_growth": 12.5},
+            recommendations=["Post more Reels — they perform best 🚀"],
+            best_platforms=["youtube"],
+            optimal_posting_times={"youtube": [18, 20]},
+            content_type_performance={"video": 0.05}
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = MetricsCollector(temp_dir)
+            try:
+                orjson_path = await collector.export_report_json(report, "orjson.json")
+                monkeypatch.setattr(metrics_collector, "orjson", None)
+                stdlib_path = await collector.export_report_json(report, "stdlib.json")
+            finally:
+                collector.close()
+
+            orjson_text = Path(orjson_path).read_text(encoding="utf-8")
+            stdlib_text = Path(stdlib_path).read_text(encoding="utf-8")
+
+        orjson_data = json.loads(orjson_text)
+        assert orjson_data == json.loads(stdlib_text)
+        assert list(orjson_data) == list(asdict(report))
+        assert orjson_data["top_performers"][0]["engagement_rate"] == 0.00001
+
+        # Non-ASCII text is written as UTF-8, not escaped, with two-space indentation
+        assert "🚀" in orjson_text and "🚀" in stdlib_text
+        assert orjson_text.startswith('{\n  "user_id": 1,') and stdlib_text.startswith('{\n  "user_id": 1,')
+
+        # ...but the text is not byte-identical: the same float is spelled differently
+        assert "1e-05" in stdlib_text and "1e-05" not in orjson_text